@@ -160,11 +160,12 @@ class AudioRecorderApp:
             # Show transcripts
             self.update_transcripts()
             
+            saved_to = summary['transcript_file'] or "nothing transcribed, no file written"
             messagebox.showinfo("Recording Stopped", 
                               f"Recording stopped successfully!\n\n"
                               f"Transcripts: {summary['transcript_count']}\n"
                               f"Session: {summary['session_id']}\n\n"
-                              f"Files saved to:\n{summary['transcript_file']}")
+                              f"Files saved to:\n{saved_to}")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to stop recording:\n{e}")
     
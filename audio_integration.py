@@ -55,7 +55,8 @@ def simple_example():
                     print(f"\n✅ Recording stopped")
                     print(f"   Session ID: {summary['session_id']}")
                     print(f"   Transcripts: {summary['transcript_count']}")
-                    print(f"   Saved to: {summary['transcript_file']}")
+                    if summary['transcript_file']:
+                        print(f"   Saved to: {summary['transcript_file']}")
             
             elif command == "status":
                 info = logger.get_session_info()
@@ -9,6 +9,7 @@ import threading
 import queue
 import json
 import os
+import re
 from datetime import datetime
 from pathlib import Path
 import logging
@@ -22,6 +23,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Transcript file names; excludes sidecars such as session_<id>.meta.json
+_SESSION_FILE_RE = re.compile(r"^session_([^.]+)\.json$")
+
 
 class AudioToTextLogger:
     """
@@ -64,9 +68,13 @@ class AudioToTextLogger:
         self.transcript_dir.mkdir(parents=True, exist_ok=True)
         
         # Session management
+        self.manifest_file = self.transcript_dir / "sessions.jsonl"
         self.session_id = None
         self.session_file = None
+        self._session_registered = False
         self.transcripts = []
+        # Incremented on every change to transcripts
+        self._version = 0
         
         # Recording state
         self.is_recording = False
@@ -97,6 +105,71 @@ class AudioToTextLogger:
         """Generate transcript filename for current session."""
         return f"session_{self.session_id}.json"
     
+    def _scan_sessions(self):
+        """Build manifest entries from session files already on disk."""
+        entries = []
+        with os.scandir(self.transcript_dir) as files:
+            for file in files:
+                match = _SESSION_FILE_RE.match(file.name)
+                if match is None or not file.is_file():
+                    continue
+                entries.append({
+                    'id': match.group(1),
+                    'created': datetime.fromtimestamp(file.stat().st_mtime).isoformat(),
+                    'audio_dir': str(self.audio_dir)
+                })
+        return sorted(entries, key=lambda entry: entry['id'])
+    
+    def rebuild_manifest(self):
+        """
+        Rewrite the sessions manifest from the transcript files on disk.
+        
+        The manifest is only appended to as sessions are saved; call this to
+        recover it after transcript files were added or deleted by hand.
+        
+        Returns:
+            list: Manifest entries that were written
+        """
+        entries = self._scan_sessions()
+        tmp_path = self.manifest_file.with_name(self.manifest_file.name + ".tmp")
+        with open(tmp_path, 'wb') as f:
+            for entry in entries:
+                f.write((json.dumps(entry, ensure_ascii=False) + "\n").encode('utf-8'))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.manifest_file)
+        return entries
+    
+    def _append_manifest(self, entries):
+        """Append session entries to the sessions manifest and sync them to disk."""
+        with open(self.manifest_file, 'ab+') as f:
+            # Terminate a line left torn by a crash so the next entry stays intact
+            if f.tell() > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    f.write(b"\n")
+            for entry in entries:
+                f.write((json.dumps(entry, ensure_ascii=False) + "\n").encode('utf-8'))
+            f.flush()
+            os.fsync(f.fileno())
+    
+    def _register_session(self):
+        """Record the current session in the sessions manifest."""
+        try:
+            if not self.manifest_file.exists():
+                # First manifest in this directory; index the sessions
+                # already on disk, including the one just saved
+                self.rebuild_manifest()
+            else:
+                self._append_manifest([{
+                    'id': self.session_id,
+                    'created': datetime.now().isoformat(),
+                    'audio_dir': str(self.audio_dir)
+                }])
+            self._session_registered = True
+        except Exception as e:
+            logger.error(f"Error updating sessions manifest: {e}")
+    
     def _save_audio_chunk(self, frames, timestamp):
         """Save audio frames to a WAV file."""
         try:
@@ -126,7 +199,12 @@ class AudioToTextLogger:
                         'started_at': self.transcripts[0]['timestamp'] if self.transcripts else None,
                         'transcripts': self.transcripts
                     }, f, indent=2, ensure_ascii=False)
+                has_transcripts = bool(self.transcripts)
             logger.info(f"Saved transcript: {filepath.name}")
+            
+            # Only sessions that produced a transcript are listed
+            if has_transcripts and not self._session_registered:
+                self._register_session()
         except Exception as e:
             logger.error(f"Error saving transcript: {e}")
     
@@ -136,7 +214,7 @@ class AudioToTextLogger:
         
         Args:
             audio_data: AudioData object from speech_recognition
-            
+        
         Returns:
             str: Transcribed text or None if failed
         """
@@ -199,7 +277,7 @@ class AudioToTextLogger:
                 self.audio.terminate()
             
             logger.info("Recording thread stopped")
-            
+        
         except Exception as e:
             logger.error(f"Recording thread error: {e}")
     
@@ -250,19 +328,20 @@ class AudioToTextLogger:
                                 
                                 with self.lock:
                                     self.transcripts.append(transcript_entry)
+                                    self._version += 1
                                 
                                 logger.info(f"Transcribed: {text[:50]}...")
                                 
                                 # Save incrementally
                                 self._save_transcript()
-                            
+                        
                         except Exception as e:
                             logger.error(f"Error processing audio chunk: {e}")
                         
                         # Reset for next interval
                         chunk_frames = []
                         last_process_time = current_time
-                
+            
             except Exception as e:
                 logger.error(f"Processing thread error: {e}")
         
@@ -289,6 +368,7 @@ class AudioToTextLogger:
                     }
                     with self.lock:
                         self.transcripts.append(transcript_entry)
+                        self._version += 1
                     self._save_transcript()
             except Exception as e:
                 logger.error(f"Error processing final chunk: {e}")
@@ -308,10 +388,13 @@ class AudioToTextLogger:
         
         # Initialize session
         self.session_id = self._generate_session_id()
-        self.transcripts = []
+        with self.lock:
+            self.transcripts = []
+            self._version += 1
         self.frames = []
         self.is_recording = True
         self.stop_event.clear()
+        self._session_registered = False
         
         # Start threads
         self.record_thread = threading.Thread(target=self._record_audio, daemon=True)
@@ -328,7 +411,8 @@ class AudioToTextLogger:
         Stop recording and transcription session.
         
         Returns:
-            dict: Session summary with transcript count and files
+            dict: Session summary with transcript count and files;
+                transcript_file is None when nothing was transcribed
         """
         if not self.is_recording:
             logger.warning("No recording in progress")
@@ -347,40 +431,44 @@ class AudioToTextLogger:
         
         self.is_recording = False
         
-        # Final save
-        self._save_transcript()
+        # Final save; a session that transcribed nothing leaves no file
+        transcript_file = None
+        if self.transcripts:
+            self._save_transcript()
+            transcript_file = str(self.transcript_dir / self._get_transcript_filename())
         
         summary = {
             'session_id': self.session_id,
             'transcript_count': len(self.transcripts),
-            'transcript_file': str(self.transcript_dir / self._get_transcript_filename()),
+            'transcript_file': transcript_file,
             'audio_dir': str(self.audio_dir)
         }
         
         logger.info(f"Recording stopped - {len(self.transcripts)} transcripts saved")
         return summary
     
-    def get_transcripts(self, session_id=None):
+    def get_transcripts(self, session_id=None, start=0):
         """
         Get transcripts for a session.
         
         Args:
             session_id: Session ID to retrieve (default: current session)
-            
+            start: Index of the first entry to return
+        
         Returns:
             list: List of transcript dictionaries
         """
         if session_id is None:
             # Return current session transcripts
             with self.lock:
-                return self.transcripts.copy()
+                return self.transcripts[start:]
         else:
             # Load from file
             try:
                 filepath = self.transcript_dir / f"session_{session_id}.json"
                 with open(filepath, 'r', encoding='utf-8') as f:
                     data = json.load(f)
-                    return data.get('transcripts', [])
+                    return data.get('transcripts', [])[start:]
             except FileNotFoundError:
                 logger.error(f"Session not found: {session_id}")
                 return []
@@ -396,7 +484,7 @@ class AudioToTextLogger:
             keywords: List of keywords to search for
             session_id: Session ID to search (default: current session)
             case_sensitive: Whether search should be case-sensitive
-            
+        
         Returns:
             list: List of matching transcript entries with keyword info
         """
@@ -421,6 +509,15 @@ class AudioToTextLogger:
         logger.info(f"Found {len(matches)} matches for keywords: {keywords}")
         return matches
     
+    def get_version(self):
+        """
+        Get a counter that changes whenever the current session's transcripts change.
+        
+        Returns:
+            int: Current version
+        """
+        return self._version
+    
     def get_session_info(self):
         """
         Get information about current recording session.
@@ -441,15 +538,29 @@ class AudioToTextLogger:
         """
         List all available recording sessions.
         
+        Reads the sessions manifest instead of scanning the transcript
+        directory, falling back to a scan when no manifest exists yet.
+        Sessions deleted or added outside the logger stay out of step
+        until rebuild_manifest() is called.
+        
         Returns:
             list: List of session IDs
         """
         try:
-            session_files = list(self.transcript_dir.glob("session_*.json"))
-            sessions = []
-            for file in session_files:
-                session_id = file.stem.replace("session_", "")
-                sessions.append(session_id)
+            if not self.manifest_file.exists():
+                return sorted((entry['id'] for entry in self._scan_sessions()), reverse=True)
+            
+            sessions = set()
+            with open(self.manifest_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        sessions.add(json.loads(line)['id'])
+                    except (ValueError, KeyError):
+                        # Skip a line torn by a crash mid-write
+                        continue
             return sorted(sessions, reverse=True)
         except Exception as e:
             logger.error(f"Error listing sessions: {e}")
@@ -67,6 +67,11 @@ class CameraClassifier:
         # Session management
         self.session_id = None
         self.classifications = []
+        # Incremented on every change to classifications
+        self._version = 0
+        
+        # Latest-only slot between the capture thread and previews
+        self._latest_q = queue.Queue(maxsize=1)
         
         # Recording state
         self.is_recording = False
@@ -196,10 +201,13 @@ class CameraClassifier:
             try:
                 current_time = time.time()
                 
-                # Capture frame every N seconds
+                # Keep the latest frame available for previews
+                ret, frame = self.camera.read()
+                if ret:
+                    self._offer_latest_frame(frame)
+                
+                # Classify a frame every N seconds
                 if current_time - last_capture_time >= self.capture_interval:
-                    ret, frame = self.camera.read()
-                    
                     if ret:
                         logger.info("Captured frame, classifying...")
                         
@@ -223,6 +231,7 @@ class CameraClassifier:
                             
                             with self.lock:
                                 self.classifications.append(classification_entry)
+                                self._version += 1
                             
                             logger.info(f"Classified: {classification['prediction']} "
                                       f"({classification['confidence']:.2f}%)")
@@ -234,8 +243,11 @@ class CameraClassifier:
                     else:
                         logger.warning("Failed to capture frame")
                 
-                # Small sleep to prevent busy waiting
-                time.sleep(0.1)
+                # camera.read() blocks until the next frame, which paces the
+                # loop and keeps the driver buffer drained. Back off only when
+                # it fails, and wake up at once if recording is stopped
+                if not ret:
+                    self.stop_event.wait(0.1)
                 
             except Exception as e:
                 logger.error(f"Capture thread error: {e}")
@@ -270,7 +282,9 @@ class CameraClassifier:
         
         # Initialize session
         self.session_id = self._generate_session_id()
-        self.classifications = []
+        with self.lock:
+            self.classifications = []
+            self._version += 1
         self.is_recording = True
         self.stop_event.clear()
         
@@ -307,6 +321,7 @@ class CameraClassifier:
             self.camera = None
         
         self.is_recording = False
+        self._take_latest_frame()
         
         # Final save
         self._save_classification()
@@ -321,12 +336,13 @@ class CameraClassifier:
         logger.info(f"Recording stopped - {len(self.classifications)} classifications saved")
         return summary
     
-    def get_classifications(self, session_id=None):
+    def get_classifications(self, session_id=None, start=0):
         """
         Get classifications for a session.
         
         Args:
             session_id: Session ID to retrieve (default: current session)
+            start: Index of the first entry to return
             
         Returns:
             list: List of classification dictionaries
@@ -334,14 +350,14 @@ class CameraClassifier:
         if session_id is None:
             # Return current session classifications
             with self.lock:
-                return self.classifications.copy()
+                return self.classifications[start:]
         else:
             # Load from file
             try:
                 filepath = self.classification_dir / f"session_{session_id}.json"
                 with open(filepath, 'r', encoding='utf-8') as f:
                     data = json.load(f)
-                    return data.get('classifications', [])
+                    return data.get('classifications', [])[start:]
             except FileNotFoundError:
                 logger.error(f"Session not found: {session_id}")
                 return []
@@ -374,6 +390,15 @@ class CameraClassifier:
         logger.info(f"Found {len(matches)} matches for defects: {defect_types}")
         return matches
     
+    def get_version(self):
+        """
+        Get a counter that changes whenever the current session's classifications change.
+        
+        Returns:
+            int: Current version
+        """
+        return self._version
+    
     def get_session_info(self):
         """
         Get information about current recording session.
@@ -408,15 +433,26 @@ class CameraClassifier:
             logger.error(f"Error listing sessions: {e}")
             return []
     
+    def _offer_latest_frame(self, frame):
+        """Replace any frame still waiting in the latest-frame slot."""
+        self._take_latest_frame()
+        self._latest_q.put_nowait(frame)
+    
+    def _take_latest_frame(self):
+        """Remove and return the frame in the latest-frame slot, or None."""
+        try:
+            return self._latest_q.get_nowait()
+        except queue.Empty:
+            return None
+    
     def get_latest_frame(self):
         """
-        Get the latest captured frame.
+        Get the newest captured frame that has not been returned yet.
+        
+        Never blocks or touches the camera. Frames that were replaced
+        before anyone asked for them are dropped.
         
         Returns:
-            numpy.ndarray: Latest frame or None
+            numpy.ndarray: Latest frame, or None when no new frame is available
         """
-        if self.camera and self.camera.isOpened():
-            ret, frame = self.camera.read()
-            if ret:
-                return frame
-        return None
+        return self._take_latest_frame()
@@ -0,0 +1,77 @@
+"""
+Shared pytest configuration for the system tests
+Run all of them in parallel with: pytest -n auto
+"""
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pytest
+
+# Cap native thread pools before any test module imports torch or numpy
+for _var in ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS"):
+    os.environ.setdefault(_var, "4")
+os.environ.setdefault("TOKENIZERS_PARALLELISM", "false")
+
+PROJECT_ROOT = Path(__file__).parent
+
+
+def _try_import(module):
+    """Import a module by name, returning (module, ok, error message)."""
+    try:
+        __import__(module)
+        return module, True, None
+    except ImportError as e:
+        return module, False, str(e)
+
+
+def probe_imports(modules):
+    """
+    Import modules in parallel worker processes.
+    
+    Heavy imports run side by side instead of back to back, and the spawned
+    workers keep them out of the test process.
+    
+    Returns:
+        list: (module, ok, error message) tuples in the order given
+    """
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=len(modules), mp_context=context) as executor:
+        return list(executor.map(_try_import, modules))
+
+
+@pytest.fixture(scope="session")
+def vit_model_path():
+    """Path to the ViT weights, skipping when they are not present."""
+    model_path = PROJECT_ROOT / "models" / "vit_weights.pth"
+    if not model_path.exists():
+        pytest.skip(f"Model file not found: {model_path}")
+    return model_path
+
+
+@pytest.fixture(scope="session")
+def vit_model(vit_model_path):
+    """Load the ViT model once and share it between tests."""
+    torch = pytest.importorskip("torch")
+    timm = pytest.importorskip("timm")
+    
+    torch.set_num_threads(4)
+    try:
+        torch.set_num_interop_threads(2)
+    except RuntimeError:
+        # Already set, or torch has started parallel work in this process
+        pass
+    
+    device = torch.device("cuda:0" if torch.cuda.is_available() else "cpu")
+    model = timm.create_model('vit_base_patch16_224',
+                              pretrained=False,
+                              num_classes=7)
+    
+    # Memory-map the checkpoint on CPU and move the weights once
+    state_dict = torch.load(vit_model_path, map_location="cpu", mmap=True, weights_only=True)
+    model.load_state_dict(state_dict, strict=True)
+    model = model.to(device)
+    model.eval()
+    return model
@@ -69,15 +69,15 @@ class AudioTextIntegration:
         # Save to transcript manager
         self.manager.save_transcript(
             session_id=self.session_id,
-            timestamp=result["timestamp"],
-            audio_file=result["audio_file"],
-            text=result["text"],
-            language=result["language"],
-            engine=result["engine"]
+            timestamp=result.timestamp,
+            audio_file=result.audio_file,
+            text=result.text,
+            language=result.language,
+            engine=result.engine
         )
         
         logger.info(f"Successfully processed and saved transcript")
-        return result["text"]
+        return result.text
     
     def process_audio_folder(self, folder_path: str, file_pattern: str = "*.wav", 
                             engine: str = "google") -> Dict[str, str]:
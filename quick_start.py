@@ -21,7 +21,7 @@ text = ati.process_audio_file("path/to/recording.wav")
 print(f"Transcription: {text}")
 
 # That's it! The transcript is automatically saved to:
-# logs/transcripts/session_my_session_001.json
+# logs/transcripts/session_my_session_001.jsonl
 
 # ========================================
 # STEP 3: RETRIEVE TRANSCRIPTS
@@ -152,9 +152,11 @@ your_project/
 │   │   ├── recording_001.wav
 │   │   └── recording_002.wav
 │   │
-│   └── transcripts/           # JSON transcripts (auto-created)
-│       ├── session_exam_123.json
-│       └── session_batch_001.json
+│   └── transcripts/           # JSON Lines transcripts (auto-created)
+│       ├── session_exam_123.jsonl
+│       ├── session_exam_123.meta.json
+│       ├── session_batch_001.jsonl
+│       └── session_batch_001.meta.json
 │
 └── exports/                   # Exported reports (auto-created)
     ├── exam_123_transcript.txt
@@ -166,27 +168,24 @@ your_project/
 # ========================================
 
 """
-logs/transcripts/session_exam_123.json:
+logs/transcripts/session_exam_123.meta.json:
+
+{
+  "session_id": "exam_123",
+  "created_at": "2025-11-07T14:30:00"
+}
+
+logs/transcripts/session_exam_123.jsonl (one transcript per line):
+
+{"timestamp": "2025-11-07T14:30:05", "audio_file": "E:/projects/logs/audio/recording_001.wav", "text": "This is the transcribed text from the audio", "language": "en-US", "engine": "google"}
+{"timestamp": "2025-11-07T14:31:12", "audio_file": "E:/projects/logs/audio/recording_002.wav", "text": "Another transcribed audio recording", "language": "en-US", "engine": "google"}
+
+export_to_json still writes the combined document:
 
 {
   "session_id": "exam_123",
   "created_at": "2025-11-07T14:30:00",
-  "transcripts": [
-    {
-      "timestamp": "2025-11-07T14:30:05",
-      "audio_file": "E:/projects/logs/audio/recording_001.wav",
-      "text": "This is the transcribed text from the audio",
-      "language": "en-US",
-      "engine": "google"
-    },
-    {
-      "timestamp": "2025-11-07T14:31:12",
-      "audio_file": "E:/projects/logs/audio/recording_002.wav",
-      "text": "Another transcribed audio recording",
-      "language": "en-US",
-      "engine": "google"
-    }
-  ]
+  "transcripts": [...]
 }
 """
 
@@ -15,6 +15,43 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def build_colmap_argv(config: Dict) -> Dict[str, List[str]]:
+    """
+    Translate a COLMAP_CONFIG-style dict into CLI options per COLMAP command
+    
+    Args:
+        config: COLMAP configuration options
+        
+    Returns:
+        Dictionary mapping command name to its list of option tokens
+    """
+    argv = {}
+    
+    for stage in ('feature_extractor', 'feature_matcher', 'mapper'):
+        argv[stage] = []
+        for key, value in config.get(stage, {}).items():
+            argv[stage].extend([f"--{key}", str(value)])
+    
+    # Dense params are split between stereo matching and fusion
+    argv['patch_match_stereo'] = []
+    argv['stereo_fusion'] = []
+    for key, value in config.get('dense', {}).items():
+        if key.startswith('filter_'):
+            filter_key = key.replace('filter_', '')
+            argv['stereo_fusion'].extend([f"--StereoFusion.{filter_key}", str(value)])
+        else:
+            argv['patch_match_stereo'].extend([f"--PatchMatchStereo.{key}", str(value)])
+    
+    return argv
+
+
+def _freeze_config(config):
+    """Snapshot a (nested) config dict as sorted tuples, so later edits can't alter it."""
+    if isinstance(config, dict):
+        return tuple(sorted((key, _freeze_config(value)) for key, value in config.items()))
+    return config
+
+
 class COLMAPWrapper:
     """Wrapper for COLMAP reconstruction pipeline"""
     
@@ -39,6 +76,9 @@ class COLMAPWrapper:
         self.sparse_path.mkdir(parents=True, exist_ok=True)
         self.dense_path.mkdir(parents=True, exist_ok=True)
         
+        # (frozen config, argv) from the last build_colmap_argv call
+        self._argv_cache = None
+        
         logger.info(f"Initialized COLMAP workspace at {self.workspace}")
     
     def run_command(self, cmd: List[str]) -> bool:
@@ -72,6 +112,23 @@ class COLMAPWrapper:
             logger.error(f"Error running command: {e}")
             return False
     
+    def _get_argv(self, config: Dict) -> Dict[str, List[str]]:
+        """
+        Get CLI options for a config, rebuilding them only when its values change
+        
+        Args:
+            config: COLMAP configuration options
+            
+        Returns:
+            Dictionary mapping command name to its list of option tokens
+        """
+        # Compare by value so a config edited in place is rebuilt
+        snapshot = _freeze_config(config)
+        if self._argv_cache is None or self._argv_cache[0] != snapshot:
+            self._argv_cache = (snapshot, build_colmap_argv(config))
+        
+        return self._argv_cache[1]
+    
     def feature_extraction(self, config: Dict = None) -> bool:
         """
         Extract SIFT features from images
@@ -92,8 +149,7 @@ class COLMAPWrapper:
         
         # Add configuration options
         if config:
-            for key, value in config.get('feature_extractor', {}).items():
-                cmd.extend([f"--{key}", str(value)])
+            cmd.extend(self._get_argv(config)['feature_extractor'])
         
         return self.run_command(cmd)
     
@@ -116,8 +172,7 @@ class COLMAPWrapper:
         
         # Add configuration options
         if config:
-            for key, value in config.get('feature_matcher', {}).items():
-                cmd.extend([f"--{key}", str(value)])
+            cmd.extend(self._get_argv(config)['feature_matcher'])
         
         return self.run_command(cmd)
     
@@ -142,8 +197,7 @@ class COLMAPWrapper:
         
         # Add configuration options
         if config:
-            for key, value in config.get('mapper', {}).items():
-                cmd.extend([f"--{key}", str(value)])
+            cmd.extend(self._get_argv(config)['mapper'])
         
         return self.run_command(cmd)
     
@@ -191,10 +245,7 @@ class COLMAPWrapper:
         ]
         
         if config:
-            for key, value in config.get('dense', {}).items():
-                if key.startswith('filter_'):
-                    continue  # Filter params are for stereo fusion
-                cmd_stereo.extend([f"--PatchMatchStereo.{key}", str(value)])
+            cmd_stereo.extend(self._get_argv(config)['patch_match_stereo'])
         
         if not self.run_command(cmd_stereo):
             return False
@@ -207,10 +258,7 @@ class COLMAPWrapper:
         ]
         
         if config:
-            for key, value in config.get('dense', {}).items():
-                if key.startswith('filter_'):
-                    filter_key = key.replace('filter_', '')
-                    cmd_fusion.extend([f"--StereoFusion.{filter_key}", str(value)])
+            cmd_fusion.extend(self._get_argv(config)['stereo_fusion'])
         
         return self.run_command(cmd_fusion)
     
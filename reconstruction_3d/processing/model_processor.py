@@ -5,8 +5,9 @@ Optimized for Python 3.13 compatibility
 """
 
 import numpy as np
-import trimesh
-from plyfile import PlyData, PlyElement
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 import logging
@@ -15,6 +16,277 @@ import json
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# PLY scalar property types -> numpy dtype codes
+_PLY_DTYPES = {
+    'char': 'i1', 'int8': 'i1', 'uchar': 'u1', 'uint8': 'u1',
+    'short': 'i2', 'int16': 'i2', 'ushort': 'u2', 'uint16': 'u2',
+    'int': 'i4', 'int32': 'i4', 'uint': 'u4', 'uint32': 'u4',
+    'float': 'f4', 'float32': 'f4', 'double': 'f8', 'float64': 'f8',
+}
+
+
+def _read_binary_ply_vertices(path: Path) -> Optional[np.ndarray]:
+    """
+    Read the vertex block of a binary little-endian PLY straight into numpy
+    
+    Handles the common COLMAP output layout (vertex element first, scalar
+    properties only). Anything else returns None so the caller can fall
+    back to plyfile.
+    
+    Args:
+        path: Path to PLY file
+        
+    Returns:
+        Structured vertex array, or None if the layout is not supported
+    """
+    with open(path, 'rb') as f:
+        if f.readline().strip() != b'ply':
+            return None
+        
+        fmt = None
+        count = None
+        fields = []
+        in_vertex = False
+        
+        for raw in f:
+            tokens = raw.split()
+            if not tokens or tokens[0] in (b'comment', b'obj_info'):
+                continue
+            
+            keyword = tokens[0]
+            if keyword == b'end_header':
+                break
+            elif keyword == b'format':
+                fmt = tokens[1]
+            elif keyword == b'element':
+                # Only the first element may be the vertex block
+                if count is not None:
+                    in_vertex = False
+                    continue
+                if tokens[1] != b'vertex':
+                    return None
+                count = int(tokens[2])
+                in_vertex = True
+            elif keyword == b'property' and in_vertex:
+                ply_type = _PLY_DTYPES.get(tokens[1].decode())
+                if ply_type is None:
+                    return None  # list properties etc.
+                fields.append((tokens[2].decode(), '<' + ply_type))
+        else:
+            return None
+        
+        if fmt != b'binary_little_endian' or count is None or not fields:
+            return None
+        
+        vertex = np.fromfile(f, dtype=np.dtype(fields), count=count)
+    
+    return vertex if len(vertex) == count else None
+
+
+# Parsed point clouds keyed by (resolved path, mtime_ns, size), least recently used first.
+# Cached arrays are read-only and shared; processing steps always build new arrays.
+_PLY_CACHE: "OrderedDict[Tuple[str, int, int], Tuple[np.ndarray, Optional[np.ndarray]]]" = OrderedDict()
+_PLY_CACHE_MAX_ENTRIES = 4
+_PLY_CACHE_LOCK = threading.Lock()
+
+
+def _ply_cache_get(key: Tuple[str, int, int]) -> Optional[Tuple[np.ndarray, Optional[np.ndarray]]]:
+    """
+    Look up a parsed point cloud and mark it most recently used
+    
+    Args:
+        key: (resolved path, mtime_ns, size) of the PLY file
+        
+    Returns:
+        Tuple of (points, colors), or None on a miss
+    """
+    with _PLY_CACHE_LOCK:
+        entry = _PLY_CACHE.get(key)
+        if entry is not None:
+            _PLY_CACHE.move_to_end(key)
+        return entry
+
+
+def _ply_cache_put(key: Tuple[str, int, int], points: np.ndarray, colors: Optional[np.ndarray]):
+    """
+    Store a parsed point cloud, evicting the least recently used entries
+    
+    Args:
+        key: (resolved path, mtime_ns, size) of the PLY file
+        points: (N, 3) float32 point array
+        colors: (N, 3) uint8 color array or None
+    """
+    points.setflags(write=False)
+    if colors is not None:
+        colors.setflags(write=False)
+    
+    with _PLY_CACHE_LOCK:
+        _PLY_CACHE[key] = (points, colors)
+        _PLY_CACHE.move_to_end(key)
+        while len(_PLY_CACHE) > _PLY_CACHE_MAX_ENTRIES:
+            _PLY_CACHE.popitem(last=False)
+
+
+# Points per cKDTree query block in statistical outlier removal
+_KNN_BLOCK_SIZE = 65536
+
+# Outlier removal queries each tree once, so favor fast construction
+# (unbalanced, non-compact nodes) over query-optimal trees
+_KDTREE_OPTIONS = {'leafsize': 32, 'balanced_tree': False, 'compact_nodes': False}
+
+
+def _pack_voxel_keys(voxel_indices: np.ndarray) -> Optional[np.ndarray]:
+    """
+    Pack integer (i, j, k) voxel coordinates into a single int64 key
+    
+    Keys preserve the lexicographic order of the coordinate rows, so a 1-D
+    np.unique over them matches np.unique(..., axis=0) without the row sort.
+    
+    Args:
+        voxel_indices: (N, 3) integer voxel coordinates
+        
+    Returns:
+        (N,) int64 keys, or None if the grid is too large to pack
+    """
+    origin = voxel_indices.min(axis=0)
+    extent = voxel_indices.max(axis=0) - origin + 1
+    if float(extent[0]) * float(extent[1]) * float(extent[2]) >= 2 ** 62:
+        return None
+    
+    shifted = voxel_indices - origin
+    return (shifted[:, 0] * extent[1] + shifted[:, 1]) * extent[2] + shifted[:, 2]
+
+
+# Vertex index triples for the four faces of a tetrahedron, and the vertex opposite each
+_TET_FACES = np.array([[1, 2, 3], [0, 2, 3], [0, 1, 3], [0, 1, 2]])
+_TET_OPPOSITE = np.array([0, 1, 2, 3])
+
+
+def _alpha_shape_surface(points: np.ndarray, alpha: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Extract the boundary surface of a 3D alpha shape
+    
+    Tetrahedra of the Delaunay tetrahedralization with circumradius below
+    1/alpha are kept; triangles belonging to exactly one kept tetrahedron
+    form the surface, oriented away from that tetrahedron.
+    
+    Args:
+        points: (N, 3) point array
+        alpha: Alpha value (larger = tighter surface)
+        
+    Returns:
+        Tuple of (vertices, faces) containing only surface vertices
+    """
+    from scipy.spatial import Delaunay
+    
+    points = np.asarray(points, dtype=np.float64)
+    tets = Delaunay(points).simplices
+    
+    # Circumradius of every tetrahedron from its edge vectors
+    corners = points[tets]
+    u = corners[:, 1] - corners[:, 0]
+    v = corners[:, 2] - corners[:, 0]
+    w = corners[:, 3] - corners[:, 0]
+    v_cross_w = np.cross(v, w)
+    det = np.einsum('ij,ij->i', u, v_cross_w)
+    numerator = (
+        np.einsum('ij,ij->i', u, u)[:, None] * v_cross_w
+        + np.einsum('ij,ij->i', v, v)[:, None] * np.cross(w, u)
+        + np.einsum('ij,ij->i', w, w)[:, None] * np.cross(u, v)
+    )
+    with np.errstate(divide='ignore', invalid='ignore'):
+        radius = np.linalg.norm(numerator, axis=1) / np.abs(2.0 * det)
+    
+    kept = tets[radius < 1.0 / alpha]  # NaN/inf (flat tets) never pass
+    if len(kept) == 0:
+        return np.empty((0, 3)), np.empty((0, 3), dtype=np.int64)
+    
+    # All 4 faces of every kept tet, plus the vertex opposite each face
+    faces = kept[:, _TET_FACES].reshape(-1, 3)
+    opposite = kept[:, _TET_OPPOSITE].reshape(-1)
+    
+    # Boundary faces appear exactly once
+    _, first, counts = np.unique(np.sort(faces, axis=1), axis=0,
+                                 return_index=True, return_counts=True)
+    boundary = first[counts == 1]
+    faces = faces[boundary]
+    opposite = opposite[boundary]
+    
+    # Flip faces whose normal points toward their own tetrahedron
+    a, b, c = points[faces[:, 0]], points[faces[:, 1]], points[faces[:, 2]]
+    normals = np.cross(b - a, c - a)
+    inward = np.einsum('ij,ij->i', normals, points[opposite] - a) > 0
+    faces[inward] = faces[inward][:, ::-1]
+    
+    # Drop interior vertices and reindex
+    used, inverse = np.unique(faces, return_inverse=True)
+    return points[used], inverse.reshape(-1, 3)
+
+
+def _laplacian_operator(mesh):
+    """
+    Build the equal-weight umbrella Laplacian of a mesh as a CSR matrix
+    
+    Each row averages a vertex's edge neighbors; isolated vertices map to
+    themselves so smoothing leaves them in place.
+    
+    Args:
+        mesh: trimesh.Trimesh
+        
+    Returns:
+        (V, V) scipy.sparse.csr_matrix
+    """
+    from scipy.sparse import csr_matrix
+    
+    num_vertices = len(mesh.vertices)
+    edges = mesh.edges_unique
+    
+    rows = np.concatenate([edges[:, 0], edges[:, 1]])
+    cols = np.concatenate([edges[:, 1], edges[:, 0]])
+    
+    degree = np.bincount(rows, minlength=num_vertices)
+    isolated = np.flatnonzero(degree == 0)
+    rows = np.concatenate([rows, isolated])
+    cols = np.concatenate([cols, isolated])
+    degree[isolated] = 1
+    
+    weights = 1.0 / degree[rows]
+    return csr_matrix((weights, (rows, cols)), shape=(num_vertices, num_vertices))
+
+
+# Fallback marker color for unknown classifications (gray, opaque)
+_DEFAULT_MARKER_COLOR = np.array([128, 128, 128, 255], dtype=np.uint8)
+
+
+@lru_cache(maxsize=None)
+def _marker_sphere(radius: float):
+    """
+    Build the marker sphere for a radius once; markers are translated copies of it
+    
+    Args:
+        radius: Marker radius in meters
+        
+    Returns:
+        Sphere mesh centered at the origin
+    """
+    import trimesh
+    return trimesh.creation.icosphere(subdivisions=3, radius=radius)
+
+
+@lru_cache(maxsize=1)
+def _marker_colors() -> Dict[str, np.ndarray]:
+    """
+    Convert the crack overlay color table to RGBA arrays once
+    
+    Returns:
+        Dictionary mapping classification to RGBA uint8 color
+    """
+    from ..config import CRACK_OVERLAY_CONFIG
+    return {
+        name: np.array(list(color) + [255], dtype=np.uint8)
+        for name, color in CRACK_OVERLAY_CONFIG['colors'].items()
+    }
+
 
 class ModelProcessor:
     """Process and enhance 3D models using trimesh"""
@@ -31,6 +303,13 @@ class ModelProcessor:
         self.mesh = None
         self.markers = []
         
+        # Shared marker sphere and per-marker (position, color) for instanced export
+        self._marker_template = None
+        self._marker_placements = []
+        
+        # (points array, min, max) memoized for get_model_info
+        self._bbox_cache = None
+        
         logger.info(f"Initialized ModelProcessor for {self.model_path}")
     
     def load_point_cloud(self) -> bool:
@@ -43,25 +322,17 @@ class ModelProcessor:
         try:
             logger.info(f"Loading point cloud from {self.model_path}")
             
-            # Load PLY file
-            plydata = PlyData.read(str(self.model_path))
-            vertex = plydata['vertex']
-            
-            # Extract coordinates
-            points = np.vstack([
-                vertex['x'],
-                vertex['y'],
-                vertex['z']
-            ]).T
-            
-            # Extract colors if available
-            colors = None
-            if 'red' in vertex and 'green' in vertex and 'blue' in vertex:
-                colors = np.vstack([
-                    vertex['red'],
-                    vertex['green'],
-                    vertex['blue']
-                ]).T
+            # Reuse the parse of an unchanged file
+            stat = self.model_path.stat()
+            cache_key = (str(self.model_path.resolve()), stat.st_mtime_ns, stat.st_size)
+            cached = _ply_cache_get(cache_key)
+            
+            if cached is not None:
+                points, colors = cached
+                logger.info("Using cached point cloud")
+            else:
+                points, colors = self._read_point_cloud()
+                _ply_cache_put(cache_key, points, colors)
             
             self.point_cloud = {
                 'points': points,
@@ -77,6 +348,38 @@ class ModelProcessor:
             logger.error(f"Failed to load point cloud: {e}")
             return False
     
+    def _read_point_cloud(self) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """
+        Parse points and colors from the PLY file
+        
+        Returns:
+            Tuple of (points, colors); colors is None if the file has none
+        """
+        # Load PLY file, reading binary vertex blocks directly when possible
+        vertex = _read_binary_ply_vertices(self.model_path)
+        if vertex is None:
+            from plyfile import PlyData
+            vertex = PlyData.read(str(self.model_path))['vertex'].data
+        fields = vertex.dtype.names
+        
+        # Extract coordinates (contiguous float32 for all downstream passes)
+        points = np.ascontiguousarray(np.vstack([
+            vertex['x'],
+            vertex['y'],
+            vertex['z']
+        ]).T, dtype=np.float32)
+        
+        # Extract colors if available
+        colors = None
+        if 'red' in fields and 'green' in fields and 'blue' in fields:
+            colors = np.ascontiguousarray(np.vstack([
+                vertex['red'],
+                vertex['green'],
+                vertex['blue']
+            ]).T, dtype=np.uint8)
+        
+        return points, colors
+    
     def load_mesh(self) -> bool:
         """
         Load mesh from file
@@ -87,6 +390,7 @@ class ModelProcessor:
         try:
             logger.info(f"Loading mesh from {self.model_path}")
             
+            import trimesh
             self.mesh = trimesh.load(str(self.model_path))
             
             if isinstance(self.mesh, trimesh.Scene):
@@ -103,6 +407,20 @@ class ModelProcessor:
             logger.error(f"Failed to load mesh: {e}")
             return False
     
+    def _get_points(self) -> np.ndarray:
+        """
+        Get the point cloud as the canonical contiguous float32 buffer
+        
+        Points from load_point_cloud already have this layout; anything a
+        caller assigned is converted once and stored back.
+        
+        Returns:
+            (N, 3) float32 point array
+        """
+        points = np.ascontiguousarray(self.point_cloud['points'], dtype=np.float32)
+        self.point_cloud['points'] = points
+        return points
+    
     def downsample_point_cloud(self, voxel_size: float = 0.02) -> bool:
         """
         Downsample point cloud using voxel grid
@@ -119,16 +437,22 @@ class ModelProcessor:
         
         try:
             logger.info(f"Downsampling with voxel size {voxel_size}")
-            points = self.point_cloud['points']
+            points = self._get_points()
             colors = self.point_cloud['colors']
             
             original_size = len(points)
             
-            # Voxelize
-            voxel_indices = np.floor(points / voxel_size).astype(int)
+            # Voxelize: scale once, shift to non-negative so truncation == floor
+            scaled = points * np.float32(1.0 / voxel_size)
+            scaled -= np.floor(scaled.min(axis=0))
+            voxel_indices = scaled.astype(np.int64)
             
-            # Get unique voxels
-            _, unique_indices = np.unique(voxel_indices, axis=0, return_index=True)
+            # Get unique voxels (first point per voxel) via one packed key per point
+            keys = _pack_voxel_keys(voxel_indices)
+            if keys is not None:
+                _, unique_indices = np.unique(keys, return_index=True)
+            else:
+                _, unique_indices = np.unique(voxel_indices, axis=0, return_index=True)
             
             self.point_cloud['points'] = points[unique_indices]
             if colors is not None:
@@ -161,7 +485,7 @@ class ModelProcessor:
         
         try:
             logger.info(f"Removing outliers using {method} method")
-            points = self.point_cloud['points']
+            points = self._get_points()
             colors = self.point_cloud['colors']
             
             original_size = len(points)
@@ -172,9 +496,14 @@ class ModelProcessor:
                 
                 # Compute distances to nearest neighbors
                 from scipy.spatial import cKDTree
-                tree = cKDTree(points)
-                distances, _ = tree.query(points, k=nb_neighbors+1)
-                avg_distances = np.mean(distances[:, 1:], axis=1)
+                tree = cKDTree(points, **_KDTREE_OPTIONS)
+                
+                # Query in blocks on all cores to bound the (block, k) distance matrix
+                avg_distances = np.empty(original_size, dtype=np.float64)
+                for start in range(0, original_size, _KNN_BLOCK_SIZE):
+                    stop = start + _KNN_BLOCK_SIZE
+                    distances, _ = tree.query(points[start:stop], k=nb_neighbors+1, workers=-1)
+                    avg_distances[start:stop] = distances[:, 1:].mean(axis=1)
                 
                 # Filter based on statistics
                 mean_dist = np.mean(avg_distances)
@@ -188,7 +517,7 @@ class ModelProcessor:
                 radius = kwargs.get('radius', 0.05)
                 
                 from scipy.spatial import cKDTree
-                tree = cKDTree(points)
+                tree = cKDTree(points, **_KDTREE_OPTIONS)
                 counts = np.array([len(tree.query_ball_point(p, radius)) for p in points])
                 
                 mask = counts >= nb_points
@@ -229,21 +558,24 @@ class ModelProcessor:
         try:
             logger.info(f"Creating mesh from point cloud using {method}...")
             
-            points = self.point_cloud['points']
+            import trimesh
+            
+            points = self._get_points()
             
             if method == 'alpha_shape':
-                # Alpha shape reconstruction
+                # Alpha shape reconstruction (boundary of the alpha complex)
                 alpha = kwargs.get('alpha', 0.1)
-                from scipy.spatial import Delaunay
+                vertices, faces = _alpha_shape_surface(points, alpha)
                 
-                # Simple alpha shape using Delaunay triangulation
-                tri = Delaunay(points)
+                if len(faces) == 0:
+                    logger.error(f"No surface found for alpha={alpha}")
+                    return False
                 
-                # Create mesh from triangulation
-                # This is a simplified version - full alpha shape is more complex
+                # Surface extraction already yields a clean, indexed mesh
                 self.mesh = trimesh.Trimesh(
-                    vertices=points,
-                    faces=tri.simplices
+                    vertices=vertices,
+                    faces=faces,
+                    process=False
                 )
                 
             elif method == 'convex_hull':
@@ -254,10 +586,6 @@ class ModelProcessor:
                 logger.error(f"Unknown mesh creation method: {method}")
                 return False
             
-            # Clean up mesh
-            self.mesh.remove_duplicate_faces()
-            self.mesh.remove_unreferenced_vertices()
-            
             logger.info(f"Created mesh: {len(self.mesh.vertices)} vertices, {len(self.mesh.faces)} faces")
             
             return True
@@ -317,7 +645,14 @@ class ModelProcessor:
         try:
             logger.info(f"Smoothing mesh ({iterations} iterations)...")
             
-            trimesh.smoothing.filter_laplacian(self.mesh, iterations=iterations)
+            import trimesh
+            
+            # CSR operator built once from the edge list; each iteration is one sparse matmul
+            trimesh.smoothing.filter_laplacian(
+                self.mesh,
+                iterations=iterations,
+                laplacian_operator=_laplacian_operator(self.mesh)
+            )
             
             logger.info("Mesh smoothed successfully")
             return True
@@ -341,26 +676,25 @@ class ModelProcessor:
             
             from ..config import CRACK_OVERLAY_CONFIG
             
+            sphere = _marker_sphere(CRACK_OVERLAY_CONFIG['marker_size'])
+            colors = _marker_colors()
+            
             self.markers = []
+            self._marker_template = sphere
+            self._marker_placements = []
             
             for ann in annotations:
                 position = np.array(ann.get('position', [0, 0, 0]))
                 classification = ann.get('classification', 'Unknown')
                 
-                # Get color for this classification
-                color = CRACK_OVERLAY_CONFIG['colors'].get(
-                    classification,
-                    [128, 128, 128]  # Default gray
-                )
-                
-                # Create sphere marker
-                marker = trimesh.primitives.Sphere(
-                    radius=CRACK_OVERLAY_CONFIG['marker_size'],
-                    center=position
-                )
-                marker.visual.face_colors = color + [255]  # Add alpha
+                # Create sphere marker from the shared template
+                color = colors.get(classification, _DEFAULT_MARKER_COLOR)
+                marker = sphere.copy()
+                marker.apply_translation(position)
+                marker.visual.face_colors = color
                 
                 self.markers.append(marker)
+                self._marker_placements.append((position, color))
             
             logger.info(f"Added {len(self.markers)} markers")
             return True
@@ -386,23 +720,25 @@ class ModelProcessor:
         try:
             logger.info(f"Saving point cloud to {output_path}")
             
-            points = self.point_cloud['points']
+            points = self._get_points()
             colors = self.point_cloud['colors']
             
-            # Prepare vertex data
-            vertex_data = [
-                (points[i, 0], points[i, 1], points[i, 2],
-                 colors[i, 0] if colors is not None else 128,
-                 colors[i, 1] if colors is not None else 128,
-                 colors[i, 2] if colors is not None else 128)
-                for i in range(len(points))
-            ]
-            
-            vertex = np.array(vertex_data, dtype=[
+            # Pack vertex data column-wise straight into the structured array
+            vertex = np.empty(len(points), dtype=[
                 ('x', 'f4'), ('y', 'f4'), ('z', 'f4'),
                 ('red', 'u1'), ('green', 'u1'), ('blue', 'u1')
             ])
+
+            for axis, name in enumerate(('x', 'y', 'z')):
+                vertex[name] = points[:, axis]
+
+            for channel, name in enumerate(('red', 'green', 'blue')):
+                if colors is not None:
+                    vertex[name] = colors[:, channel]
+                else:
+                    vertex[name].fill(128)  # Default gray
             
+            from plyfile import PlyData, PlyElement
             el = PlyElement.describe(vertex, 'vertex')
             PlyData([el]).write(output_path)
             
@@ -413,6 +749,76 @@ class ModelProcessor:
             logger.error(f"Failed to save point cloud: {e}")
             return False
     
+    def _combine_with_markers(self):
+        """
+        Merge the mesh and all markers into one face-colored mesh
+        
+        Vertex/face/color arrays are gathered once and concatenated in a
+        single pass, with face indices offset per part.
+        
+        Returns:
+            Combined trimesh.Trimesh
+        """
+        import trimesh
+        
+        vertices, faces, face_colors = [], [], []
+        offset = 0
+        
+        for part in [self.mesh] + self.markers:
+            visual = part.visual
+            if visual.kind == 'texture':
+                visual = visual.to_color()
+            
+            vertices.append(part.vertices)
+            faces.append(part.faces + offset)
+            face_colors.append(visual.face_colors)
+            offset += len(part.vertices)
+        
+        return trimesh.Trimesh(
+            vertices=np.concatenate(vertices),
+            faces=np.concatenate(faces),
+            face_colors=np.concatenate(face_colors),
+            process=False
+        )
+    
+    def _instanced_marker_scene(self):
+        """
+        Build a scene with one sphere mesh per marker color, placed by node transforms
+        
+        glTF stores each shared mesh once and references it from every node,
+        so the marker geometry no longer scales with the number of markers.
+        
+        Returns:
+            trimesh.Scene with the model and instanced markers
+        """
+        import trimesh
+        
+        scene = trimesh.Scene()
+        scene.add_geometry(self.mesh, geom_name='model', node_name='model')
+        
+        # Group marker positions by color, one shared sphere per group
+        groups = {}
+        for position, color in self._marker_placements:
+            groups.setdefault(tuple(color), []).append(position)
+        
+        for group_idx, (color, positions) in enumerate(groups.items()):
+            geom_name = f"marker_{group_idx}"
+            sphere = self._marker_template.copy()
+            sphere.visual.face_colors = color
+            
+            for idx, position in enumerate(positions):
+                transform = trimesh.transformations.translation_matrix(position)
+                node_name = f"{geom_name}_{idx}"
+                if idx == 0:
+                    scene.add_geometry(sphere, geom_name=geom_name,
+                                       node_name=node_name, transform=transform)
+                else:
+                    scene.graph.update(frame_to=node_name,
+                                       frame_from=scene.graph.base_frame,
+                                       matrix=transform, geometry=geom_name)
+        
+        return scene
+    
     def save_mesh(self, output_path: str, file_type: str = None) -> bool:
         """
         Save mesh
@@ -431,9 +837,13 @@ class ModelProcessor:
         try:
             logger.info(f"Saving mesh to {output_path}")
             
+            export_type = (file_type or Path(output_path).suffix.lstrip('.')).lower()
+            
             # Combine mesh with markers if they exist
-            if self.markers:
-                combined = trimesh.util.concatenate([self.mesh] + self.markers)
+            if self.markers and self._marker_placements and export_type in ('glb', 'gltf'):
+                self._instanced_marker_scene().export(output_path, file_type=file_type)
+            elif self.markers:
+                combined = self._combine_with_markers()
                 combined.export(output_path, file_type=file_type)
             else:
                 self.mesh.export(output_path, file_type=file_type)
@@ -445,6 +855,24 @@ class ModelProcessor:
             logger.error(f"Failed to save mesh: {e}")
             return False
     
+    def _get_bounding_box(self, points: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the point cloud bounding box, reusing the last result
+        
+        Every processing step replaces the points array rather than editing
+        it in place, so the cache is keyed on the array object itself.
+        
+        Args:
+            points: (N, 3) point array
+            
+        Returns:
+            Tuple of (min, max) corner arrays
+        """
+        if self._bbox_cache is None or self._bbox_cache[0] is not points:
+            self._bbox_cache = (points, points.min(axis=0), points.max(axis=0))
+        
+        return self._bbox_cache[1], self._bbox_cache[2]
+    
     def get_model_info(self) -> Dict:
         """
         Get information about the current model
@@ -456,12 +884,13 @@ class ModelProcessor:
         
         if self.point_cloud is not None:
             points = self.point_cloud['points']
+            bbox_min, bbox_max = self._get_bounding_box(points)
             info['point_cloud'] = {
                 'num_points': len(points),
                 'has_colors': self.point_cloud['colors'] is not None,
                 'bounding_box': {
-                    'min': points.min(axis=0).tolist(),
-                    'max': points.max(axis=0).tolist(),
+                    'min': bbox_min.tolist(),
+                    'max': bbox_max.tolist(),
                 }
             }
         
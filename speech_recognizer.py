@@ -1,43 +1,393 @@
 """
 Speech Recognizer Module
-Converts audio files to text using Google Speech API and optional Whisper
+Converts audio files to text using Google Speech API, optional Google Cloud
+streaming recognition, and optional Whisper
 """
 
 import speech_recognition as sr
+import numpy as np
 from pathlib import Path
-from typing import Optional, Dict, List
+from typing import Optional, AsyncIterable, Dict, Iterator, List, Tuple
+import asyncio
+import hashlib
+import importlib.util
+import json
 import logging
+import os
+import threading
+import wave
+from collections import OrderedDict
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
 from datetime import datetime
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+    _dumps = orjson.dumps
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+try:
+    # Request building and response parsing behind recognize_google
+    from speech_recognition.recognizers import google as _sr_google
+except ImportError:
+    _sr_google = None
+
+try:
+    import xxhash
+    
+    def _content_hash(data) -> str:
+        return xxhash.xxh3_64(data).hexdigest()
+except ImportError:
+    def _content_hash(data) -> str:
+        return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+# Upper bound on simultaneous Google API requests across all recognizers
+GOOGLE_MAX_CONCURRENT_REQUESTS = 5
+_google_request_slots = threading.BoundedSemaphore(GOOGLE_MAX_CONCURRENT_REQUESTS)
+
+# Endpoint used by speech_recognition's recognize_google, over TLS
+GOOGLE_SPEECH_URL = "https://www.google.com/speech-api/v2/recognize"
+
+# Highest sample rate worth uploading to Google; its models run at 16 kHz
+GOOGLE_UPLOAD_SAMPLE_RATE = 16000
+
+# Audio sent per Google Cloud streaming request
+STREAM_CHUNK_SECONDS = 0.1
+
+# Speech segments decoded per forward pass by the batched Whisper pipeline
+WHISPER_BATCH_SIZE = 16
+
+# Files decoded ahead per batch worker; bounds decoded audio held in memory
+WHISPER_DECODE_WINDOW_PER_WORKER = 2
+
+# Recordings longer than this are not stored in the transcript cache
+TRANSCRIPT_CACHE_MAX_SECONDS = 600
+
+# Frame length used to find silence when splitting long recordings
+SILENCE_FRAME_SECONDS = 0.03
+
+# Sample rate Whisper expects for in-memory audio
+WHISPER_SAMPLE_RATE = 16000
+
+# Resolves relative audio paths without a getcwd() call per result
+_CWD = os.getcwd()
+
+# Decoded PCM keyed by (resolved path, mtime_ns, size), least recently used first
+_PCM_CACHE: "OrderedDict[Tuple[str, int, int], Tuple[np.ndarray, int]]" = OrderedDict()
+_PCM_CACHE_MAX_ENTRIES = 8
+_PCM_CACHE_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _google_session():
+    """
+    Get the HTTP session shared by all Google requests
+    
+    Keeping connections alive avoids a TCP and TLS handshake per file, and
+    throttling or transient server errors are retried with backoff.
+    
+    Returns:
+        requests.Session, or None if requests is not installed
+    """
+    try:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+    except ImportError:
+        return None
+    
+    retry = Retry(
+        total=2,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=frozenset({"POST"}),
+    )
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=GOOGLE_MAX_CONCURRENT_REQUESTS * 2,
+        max_retries=retry,
+    ))
+    return session
+
+
+async def _acquire_request_slot():
+    """
+    Wait for a Google request slot without blocking the event loop
+    
+    The blocking acquire runs on a worker thread, which cannot be
+    interrupted. If the caller is cancelled while waiting, the slot is
+    released as soon as that thread gets it, so it is not lost.
+    """
+    acquire = asyncio.ensure_future(asyncio.to_thread(_google_request_slots.acquire))
+    try:
+        await asyncio.shield(acquire)
+    except asyncio.CancelledError:
+        def release(future):
+            if not future.cancelled() and future.exception() is None:
+                _google_request_slots.release()
+        acquire.add_done_callback(release)
+        raise
+
+
+def _wav_to_int16(raw: bytes, sample_width: int) -> Optional[np.ndarray]:
+    """
+    Convert little-endian PCM frames of any common width to int16
+    
+    Args:
+        raw: Interleaved PCM bytes
+        sample_width: Bytes per sample (1, 2, 3 or 4)
+    
+    Returns:
+        int16 samples, or None for an unsupported width
+    """
+    if sample_width == 2:
+        return np.frombuffer(raw, dtype='<i2')
+    if sample_width == 1:
+        # 8-bit WAV is unsigned
+        return ((np.frombuffer(raw, dtype=np.uint8).astype(np.int16) - 128) << 8).astype(np.int16)
+    if sample_width == 3:
+        # Keep the two most significant bytes of each 24-bit sample
+        packed = np.frombuffer(raw, dtype=np.uint8).reshape(-1, 3)
+        return np.ascontiguousarray(packed[:, 1:]).view('<i2').ravel()
+    if sample_width == 4:
+        return (np.frombuffer(raw, dtype='<i4') >> 16).astype(np.int16)
+    return None
+
+
+def _decode_pcm(audio_file_path: str) -> Optional[Tuple[np.ndarray, int]]:
+    """
+    Decode an audio file to mono 16-bit samples
+    
+    PCM WAV files, the format audio_logger records, are read directly with
+    the wave module; anything else goes through soundfile when installed.
+    
+    Args:
+        audio_file_path: Path to the audio file
+    
+    Returns:
+        Tuple of (int16 samples, sample rate), or None if the format is unsupported
+    """
+    if os.fspath(audio_file_path).lower().endswith('.wav'):
+        try:
+            with wave.open(audio_file_path, 'rb') as wav:
+                channels = wav.getnchannels()
+                sample_rate = wav.getframerate()
+                sample_width = wav.getsampwidth()
+                raw = wav.readframes(wav.getnframes())
+            
+            # Drop a partial last frame left by a truncated recording
+            frame_size = sample_width * channels
+            if len(raw) % frame_size:
+                raw = raw[:len(raw) - len(raw) % frame_size]
+            
+            samples = _wav_to_int16(raw, sample_width)
+            if samples is not None:
+                if channels > 1:
+                    samples = samples.reshape(-1, channels).mean(axis=1).astype(np.int16)
+                return samples, sample_rate
+        except (wave.Error, EOFError, ValueError):
+            pass
+    
+    try:
+        import soundfile
+    except ImportError:
+        return None
+    
+    try:
+        samples, sample_rate = soundfile.read(audio_file_path, dtype='int16', always_2d=True)
+    except RuntimeError:
+        return None
+    if samples.shape[1] > 1:
+        return samples.mean(axis=1).astype(np.int16), sample_rate
+    return samples[:, 0].copy(), sample_rate
+
+
+def _load_pcm(audio_file_path: str) -> Optional[Tuple[np.ndarray, int]]:
+    """
+    Decode an audio file once and reuse the samples until the file changes
+    
+    Args:
+        audio_file_path: Path to the audio file
+    
+    Returns:
+        Tuple of (read-only int16 samples, sample rate), or None if the
+        format is unsupported
+    """
+    path = Path(audio_file_path)
+    stat = path.stat()
+    key = (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+    
+    with _PCM_CACHE_LOCK:
+        entry = _PCM_CACHE.get(key)
+        if entry is not None:
+            _PCM_CACHE.move_to_end(key)
+            return entry
+    
+    entry = _decode_pcm(audio_file_path)
+    if entry is None:
+        return None
+    entry[0].flags.writeable = False
+    
+    with _PCM_CACHE_LOCK:
+        _PCM_CACHE[key] = entry
+        _PCM_CACHE.move_to_end(key)
+        while len(_PCM_CACHE) > _PCM_CACHE_MAX_ENTRIES:
+            _PCM_CACHE.popitem(last=False)
+    return entry
+
+
+def _split_points(samples: np.ndarray, sample_rate: int, chunk_seconds: float,
+                  search_seconds: float = 5.0) -> List[int]:
+    """
+    Pick chunk boundaries at the quietest moment near each chunk mark
+    
+    Args:
+        samples: Mono int16 samples
+        sample_rate: Samples per second
+        chunk_seconds: Target chunk length in seconds
+        search_seconds: How far either side of a mark to look for silence
+    
+    Returns:
+        Sample offsets starting at 0 and ending at len(samples)
+    """
+    frame = max(1, int(sample_rate * SILENCE_FRAME_SECONDS))
+    usable = len(samples) // frame * frame
+    energy = np.square(samples[:usable].reshape(-1, frame).astype(np.float32)).mean(axis=1)
+    
+    chunk_frames = int(chunk_seconds * sample_rate) // frame
+    search_frames = int(search_seconds * sample_rate) // frame
+    
+    bounds = [0]
+    mark = chunk_frames
+    while mark < len(energy):
+        lo = max(bounds[-1] // frame + 1, mark - search_frames)
+        hi = min(len(energy), mark + search_frames + 1)
+        cut = lo + int(np.argmin(energy[lo:hi]))
+        bounds.append(cut * frame)
+        mark = cut + chunk_frames
+    bounds.append(len(samples))
+    return bounds
+
+
+def _trim_repeated_prefix(previous: List[str], words: List[str],
+                          max_words: int = 8) -> List[str]:
+    """
+    Drop words at the start of a chunk that repeat the end of the last one
+    
+    Args:
+        previous: Words transcribed so far
+        words: Words of the next chunk
+        max_words: Longest seam overlap to look for
+    
+    Returns:
+        The next chunk's words without the repeated prefix
+    """
+    def norm(word):
+        return word.lower().strip(".,!?;:")
+    
+    for size in range(min(max_words, len(previous), len(words)), 0, -1):
+        if [norm(w) for w in previous[-size:]] == [norm(w) for w in words[:size]]:
+            return words[size:]
+    return words
+
+
+@dataclass
+class TranscriptionResult:
+    """
+    Transcribed text with its metadata
+    """
+    __slots__ = ("timestamp", "audio_file", "text", "language", "engine")
+    
+    timestamp: str
+    audio_file: str
+    text: str
+    language: str
+    engine: str
+    
+    def to_dict(self) -> Dict[str, str]:
+        """
+        Convert to the plain dictionary shape used for JSON output
+        
+        Returns:
+            Dictionary with timestamp, audio_file, text, language and engine
+        """
+        return asdict(self)
+
 
 class SpeechRecognizer:
     """
     Handles audio-to-text transcription using multiple engines
     """
     
-    def __init__(self, default_language: str = "en-US"):
+    # (backend, model) pairs keyed by size, shared by every instance in the process
+    _whisper_models: Dict[str, Tuple[str, object]] = {}
+    _whisper_lock = threading.Lock()
+    
+    def __init__(self, default_language: str = "en-US", preload_whisper: bool = False,
+                 cache_dir: Optional[str] = None,
+                 max_cache_bytes: int = 1 << 30):
         """
         Initialize the speech recognizer
         
         Args:
             default_language: Language code for transcription (e.g., 'en-US', 'hi-IN')
+            preload_whisper: Load the Whisper model on a background thread now
+                instead of on the first Whisper transcription
+            cache_dir: Directory for transcripts keyed by audio content;
+                the cache is off unless one is given. Keep it outside
+                logs/transcripts, which the session tools scan
+            max_cache_bytes: Size at which the oldest cached transcripts are evicted
         """
         self.recognizer = sr.Recognizer()
         self.language = default_language
-        self.whisper_available = False
+        self._speech_client = None
+        self.whisper_model_size = "base"
         
-        # Try to import whisper for offline transcription
-        try:
-            import whisper
-            self.whisper_model = None
-            self.whisper_available = True
+        # Transcript cache
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.max_cache_bytes = max_cache_bytes
+        self._cache_bytes: Optional[int] = None
+        self._cache_lock = threading.Lock()
+        
+        # Probe for whisper without importing it; the import happens on first use
+        self.whisper_available = any(
+            importlib.util.find_spec(name) is not None
+            for name in ("faster_whisper", "whisper")
+        )
+        if self.whisper_available:
             logger.info("Whisper support available")
-        except ImportError:
-            logger.info("Whisper not available. Install with: pip install openai-whisper")
+        else:
+            logger.info("Whisper not available. Install with: pip install faster-whisper")
+        
+        if preload_whisper and self.whisper_available:
+            threading.Thread(target=self._ensure_whisper_model, daemon=True).start()
+    
+    def calibrate(self, audio_file_path: str, duration: float = 0.5) -> float:
+        """
+        Fit the energy threshold to the ambient noise at the start of a file
+        
+        The threshold only matters for listen()-style microphone capture;
+        recognize_google ignores it, so file transcription never needs this.
+        
+        Args:
+            audio_file_path: Path to a recording of the environment
+            duration: Seconds of audio to sample
+        
+        Returns:
+            The new energy threshold
+        """
+        with sr.AudioFile(audio_file_path) as source:
+            self.recognizer.adjust_for_ambient_noise(source, duration=duration)
+        logger.info(f"Energy threshold calibrated to {self.recognizer.energy_threshold:.1f}")
+        return self.recognizer.energy_threshold
     
     def set_language(self, language_code: str):
         """
@@ -55,7 +405,7 @@ class SpeechRecognizer:
         
         Args:
             audio_file_path: Path to the audio file (WAV format recommended)
-            engine: Transcription engine ('google' or 'whisper')
+            engine: Transcription engine ('google', 'google_cloud' or 'whisper')
         
         Returns:
             Transcribed text string, or None if transcription fails
@@ -66,11 +416,25 @@ class SpeechRecognizer:
             logger.error(f"Audio file not found: {audio_file_path}")
             return None
         
+        if engine == "whisper" and self.whisper_available:
+            engine, transcribe = f"whisper-{self.whisper_model_size}", self._transcribe_with_whisper
+        elif engine == "google_cloud":
+            transcribe = self._transcribe_with_google_cloud
+        else:
+            engine, transcribe = "google", self._transcribe_with_google
+        
+        cache_path = self._cache_path(audio_file_path, engine)
+        if cache_path is not None:
+            text = self._cache_get(cache_path)
+            if text is not None:
+                logger.info(f"Using cached transcription: {audio_file_path}")
+                return text
+        
         try:
-            if engine == "whisper" and self.whisper_available:
-                return self._transcribe_with_whisper(audio_file_path)
-            else:
-                return self._transcribe_with_google(audio_file_path)
+            text = transcribe(audio_file_path)
+            if text and cache_path is not None:
+                self._cache_put(cache_path, text)
+            return text
         
         except sr.UnknownValueError:
             logger.warning(f"No speech detected in: {audio_file_path}")
@@ -84,10 +448,110 @@ class SpeechRecognizer:
             logger.error(f"Transcription error: {e}")
             return None
     
+    def _cache_path(self, audio_file_path: str, engine: str) -> Optional[Path]:
+        """
+        Locate the cache entry for a file's decoded audio
+        
+        Keying on samples rather than file bytes lets re-encoded copies of
+        the same recording hit the cache.
+        
+        Args:
+            audio_file_path: Path to the audio file
+            engine: Engine that will transcribe the file
+        
+        Returns:
+            Path of the cache entry, or None if the file should not be cached
+        """
+        if self.cache_dir is None:
+            return None
+        
+        # A file we cannot decode is not cached; the engine may still read it
+        try:
+            pcm = _load_pcm(audio_file_path)
+        except (OSError, ValueError, EOFError, wave.Error) as e:
+            logger.debug(f"Not caching {audio_file_path}: {e}")
+            return None
+        if pcm is None:
+            return None
+        samples, sample_rate = pcm
+        if len(samples) > TRANSCRIPT_CACHE_MAX_SECONDS * sample_rate:
+            return None
+        
+        key = _content_hash(samples) + f"{sample_rate:x}"
+        return self.cache_dir / f"{key}-{engine}-{self.language}.json"
+    
+    def _cache_get(self, cache_path: Path) -> Optional[str]:
+        """
+        Read a cached transcript and mark it recently used
+        
+        Args:
+            cache_path: Path of the cache entry
+        
+        Returns:
+            Cached text, or None on a miss
+        """
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                text = json.load(f)["text"]
+            os.utime(cache_path)
+            return text
+        except (OSError, ValueError, KeyError):
+            return None
+    
+    def _cache_put(self, cache_path: Path, text: str):
+        """
+        Store a transcript atomically, evicting the oldest entries when full
+        
+        Args:
+            cache_path: Path of the cache entry
+            text: Transcribed text
+        """
+        try:
+            with self._cache_lock:
+                if self._cache_bytes is None:
+                    self.cache_dir.mkdir(parents=True, exist_ok=True)
+                    self._cache_bytes = sum(entry.stat().st_size for entry in self._cache_entries())
+                
+                data = _dumps({"text": text})
+                tmp_path = cache_path.with_name(f"{cache_path.name}.{threading.get_ident()}.tmp")
+                with open(tmp_path, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp_path, cache_path)
+                self._cache_bytes += len(data)
+                
+                if self._cache_bytes > self.max_cache_bytes:
+                    self._evict_cache()
+        except OSError as e:
+            logger.warning(f"Could not cache transcription: {e}")
+    
+    def _cache_entries(self) -> List[os.DirEntry]:
+        """List the transcript cache entries."""
+        with os.scandir(self.cache_dir) as entries:
+            return [entry for entry in entries if entry.name.endswith(".json")]
+    
+    def _evict_cache(self):
+        """Delete the least recently used cache entries until under the size limit."""
+        entries = sorted(
+            (entry.stat().st_mtime, entry.stat().st_size, entry.path)
+            for entry in self._cache_entries()
+        )
+        self._cache_bytes = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if self._cache_bytes <= self.max_cache_bytes:
+                break
+            try:
+                os.remove(path)
+                self._cache_bytes -= size
+            except OSError:
+                pass
+    
     def _transcribe_with_google(self, audio_file_path: str) -> Optional[str]:
         """
         Transcribe using Google Speech Recognition API (online, free)
         
+        recognize_google uploads FLAC at the source rate, so audio above
+        16 kHz is resampled first to keep the upload small.
+        
         Args:
             audio_file_path: Path to audio file
         
@@ -95,13 +559,15 @@ class SpeechRecognizer:
             Transcribed text or None
         """
         try:
-            with sr.AudioFile(audio_file_path) as source:
-                # Adjust for ambient noise
-                self.recognizer.adjust_for_ambient_noise(source, duration=0.5)
-                audio_data = self.recognizer.record(source)
+            pcm = _load_pcm(audio_file_path)
+            if pcm is not None:
+                samples, sample_rate = pcm
+                audio_data = sr.AudioData(samples.tobytes(), sample_rate, 2)
+            else:
+                with sr.AudioFile(audio_file_path) as source:
+                    audio_data = self.recognizer.record(source)
             
-            # Perform recognition
-            text = self.recognizer.recognize_google(audio_data, language=self.language)
+            text = self._recognize_google(audio_data)
             logger.info(f"Successfully transcribed: {audio_file_path}")
             return text
         
@@ -109,9 +575,248 @@ class SpeechRecognizer:
             logger.error(f"Google transcription error: {e}")
             raise
     
+    def _recognize_google(self, audio_data: sr.AudioData) -> str:
+        """
+        Send in-memory audio to the Google Speech Recognition API
+        
+        The request and response are built and parsed by speech_recognition
+        itself, as in recognize_google; only the transport differs, using the
+        shared keep-alive session when requests is installed.
+        
+        Args:
+            audio_data: Audio to recognize
+        
+        Returns:
+            Transcribed text
+        """
+        if audio_data.sample_rate > GOOGLE_UPLOAD_SAMPLE_RATE:
+            logger.debug(f"Resampling from {audio_data.sample_rate} Hz "
+                         f"to {GOOGLE_UPLOAD_SAMPLE_RATE} Hz for upload")
+            audio_data = sr.AudioData(
+                audio_data.get_raw_data(convert_rate=GOOGLE_UPLOAD_SAMPLE_RATE, convert_width=2),
+                GOOGLE_UPLOAD_SAMPLE_RATE, 2
+            )
+        
+        session = _google_session()
+        if session is None or _sr_google is None:
+            with _google_request_slots:
+                return self.recognizer.recognize_google(audio_data, language=self.language)
+        
+        import requests
+        
+        request = _sr_google.create_request_builder(
+            endpoint=GOOGLE_SPEECH_URL, language=self.language
+        ).build(audio_data)
+        
+        # Perform recognition (rate-limited across threads)
+        try:
+            with _google_request_slots:
+                response = session.post(
+                    request.full_url, data=request.data,
+                    headers=dict(request.header_items()),
+                    timeout=self.recognizer.operation_timeout,
+                )
+            response.raise_for_status()
+        except requests.RequestException as e:
+            raise sr.RequestError(f"recognition request failed: {e}")
+        
+        output_parser = _sr_google.OutputParser(show_all=False, with_confidence=False)
+        return output_parser.parse(response.text)
+    
+    def _transcribe_with_google_cloud(self, audio_file_path: str) -> Optional[str]:
+        """
+        Transcribe using Google Cloud Speech streaming recognition
+        
+        Audio is sent in 100 ms LINEAR16 chunks as it is read from the WAV,
+        so recognition overlaps the upload instead of waiting for it.
+        Requires google-cloud-speech and application default credentials.
+        
+        Args:
+            audio_file_path: Path to 16-bit PCM WAV file
+        
+        Returns:
+            Transcribed text or None
+        """
+        try:
+            try:
+                from google.cloud import speech
+            except ImportError:
+                logger.error("Google Cloud Speech not available. Install with: pip install google-cloud-speech")
+                raise
+            
+            if self._speech_client is None:
+                self._speech_client = speech.SpeechClient()
+            
+            with wave.open(audio_file_path, 'rb') as wav:
+                streaming_config = speech.StreamingRecognitionConfig(
+                    config=speech.RecognitionConfig(
+                        encoding=speech.RecognitionConfig.AudioEncoding.LINEAR16,
+                        sample_rate_hertz=wav.getframerate(),
+                        audio_channel_count=wav.getnchannels(),
+                        language_code=self.language,
+                    )
+                )
+                frames_per_chunk = max(1, int(wav.getframerate() * STREAM_CHUNK_SECONDS))
+                
+                def requests():
+                    while True:
+                        chunk = wav.readframes(frames_per_chunk)
+                        if not chunk:
+                            return
+                        yield speech.StreamingRecognizeRequest(audio_content=chunk)
+                
+                with _google_request_slots:
+                    responses = self._speech_client.streaming_recognize(
+                        config=streaming_config, requests=requests()
+                    )
+                    
+                    # Keep only finalized results
+                    parts = [
+                        result.alternatives[0].transcript.strip()
+                        for response in responses
+                        for result in response.results
+                        if result.is_final and result.alternatives
+                    ]
+            
+            if not parts:
+                raise sr.UnknownValueError()
+            
+            text = " ".join(parts)
+            logger.info(f"Successfully transcribed with Google Cloud: {audio_file_path}")
+            return text
+        
+        except sr.UnknownValueError:
+            raise
+        
+        except Exception as e:
+            logger.error(f"Google Cloud transcription error: {e}")
+            raise
+    
+    @classmethod
+    def _get_whisper_model(cls, size: str):
+        """
+        Get a Whisper model, loading it once per process
+        
+        Prefers faster-whisper with int8 weights and falls back to the
+        reference openai-whisper package.
+        
+        Args:
+            size: Whisper model size ("tiny", "base", "small", ...)
+        
+        Returns:
+            Tuple of (backend name, loaded model)
+        """
+        entry = cls._whisper_models.get(size)
+        if entry is None:
+            with cls._whisper_lock:
+                entry = cls._whisper_models.get(size)
+                if entry is None:
+                    logger.info("Loading Whisper model (this may take a moment)...")
+                    entry = cls._load_whisper_model(size)
+                    cls._whisper_models[size] = entry
+        return entry
+    
+    def _ensure_whisper_model(self):
+        """Load this recognizer's Whisper model ahead of its first use."""
+        try:
+            self._get_whisper_model(self.whisper_model_size)
+        except Exception as e:
+            logger.error(f"Whisper preload failed: {e}")
+    
+    @staticmethod
+    def _load_whisper_model(size: str) -> Tuple[str, object]:
+        """
+        Load a Whisper model from the fastest available backend
+        
+        Args:
+            size: Whisper model size
+        
+        Returns:
+            Tuple of (backend name, loaded model)
+        """
+        download_root = os.environ.get("WHISPER_MODEL_CACHE_DIR")
+        
+        try:
+            import ctranslate2
+            from faster_whisper import WhisperModel
+        except ImportError:
+            import whisper
+            return "whisper", whisper.load_model(size, download_root=download_root)
+        
+        use_cuda = ctranslate2.get_cuda_device_count() > 0
+        model = WhisperModel(
+            size,
+            device="cuda" if use_cuda else "cpu",
+            compute_type="int8_float16" if use_cuda else "int8",
+            num_workers=max(1, (os.cpu_count() or 2) // 2),
+            download_root=download_root,
+        )
+        return "faster_whisper", model
+    
+    async def transcribe_stream(self, chunks: AsyncIterable[bytes],
+                                sample_rate: int = 16000) -> Optional[str]:
+        """
+        Transcribe audio as it arrives using Google Cloud streaming recognition
+        
+        Chunks are forwarded as soon as they are received, so an upload can
+        be transcribed while it is still coming in, without a temp file.
+        
+        Args:
+            chunks: Async iterable of 16-bit mono PCM byte chunks
+            sample_rate: Sample rate of the PCM data
+        
+        Returns:
+            Transcribed text string, or None if transcription fails
+        """
+        try:
+            from google.cloud import speech
+        except ImportError:
+            logger.error("Google Cloud Speech not available. Install with: pip install google-cloud-speech")
+            return None
+        
+        streaming_config = speech.StreamingRecognitionConfig(
+            config=speech.RecognitionConfig(
+                encoding=speech.RecognitionConfig.AudioEncoding.LINEAR16,
+                sample_rate_hertz=sample_rate,
+                language_code=self.language,
+            )
+        )
+        
+        async def requests():
+            yield speech.StreamingRecognizeRequest(streaming_config=streaming_config)
+            async for chunk in chunks:
+                if chunk:
+                    yield speech.StreamingRecognizeRequest(audio_content=chunk)
+        
+        try:
+            # The async client is bound to the running event loop
+            client = speech.SpeechAsyncClient()
+            
+            await _acquire_request_slot()
+            try:
+                responses = await client.streaming_recognize(requests=requests())
+                parts = []
+                async for response in responses:
+                    for result in response.results:
+                        if result.is_final and result.alternatives:
+                            parts.append(result.alternatives[0].transcript.strip())
+            finally:
+                _google_request_slots.release()
+        
+        except Exception as e:
+            logger.error(f"Streaming transcription error: {e}")
+            return None
+        
+        if not parts:
+            logger.warning("No speech detected in stream")
+            return None
+        
+        logger.info("Successfully transcribed stream")
+        return " ".join(parts)
+    
     def _transcribe_with_whisper(self, audio_file_path: str) -> Optional[str]:
         """
-        Transcribe using OpenAI Whisper (offline, accurate)
+        Transcribe using Whisper (offline, accurate)
         
         Args:
             audio_file_path: Path to audio file
@@ -120,16 +825,25 @@ class SpeechRecognizer:
             Transcribed text or None
         """
         try:
-            import whisper
+            backend, model = self._get_whisper_model(self.whisper_model_size)
+            language = self.language.split('-')[0]
             
-            # Load model if not already loaded (lazy loading)
-            if self.whisper_model is None:
-                logger.info("Loading Whisper model (this may take a moment)...")
-                self.whisper_model = whisper.load_model("base")
+            # Feed already-decoded audio when it is at Whisper's rate, else let
+            # the backend decode (and resample) the file itself
+            audio = audio_file_path
+            pcm = _load_pcm(audio_file_path)
+            if pcm is not None and pcm[1] == WHISPER_SAMPLE_RATE:
+                audio = pcm[0].astype(np.float32) / 32768.0
             
             # Transcribe
-            result = self.whisper_model.transcribe(audio_file_path, language=self.language.split('-')[0])
-            text = result["text"].strip()
+            if backend == "faster_whisper":
+                segments, _ = model.transcribe(
+                    audio, language=language, vad_filter=True, beam_size=5
+                )
+                text = " ".join(segment.text.strip() for segment in segments).strip()
+            else:
+                result = model.transcribe(audio, language=language)
+                text = result["text"].strip()
             
             logger.info(f"Successfully transcribed with Whisper: {audio_file_path}")
             return text
@@ -138,64 +852,280 @@ class SpeechRecognizer:
             logger.error(f"Whisper transcription error: {e}")
             raise
     
-    def transcribe_with_timestamp(self, audio_file_path: str, engine: str = "google") -> Optional[Dict]:
+    def transcribe_long_file(self, audio_file_path: str, chunk_seconds: float = 30,
+                             overlap: float = 0.5, max_workers: int = 4) -> Optional[str]:
+        """
+        Transcribe a long recording with Google in parallel chunks
+        
+        The file is cut at the quietest point near every chunk_seconds mark,
+        each chunk (plus a little overlap) is recognized concurrently, and
+        words repeated across a seam are dropped when the texts are joined.
+        
+        Args:
+            audio_file_path: Path to the audio file
+            chunk_seconds: Target chunk length in seconds
+            overlap: Seconds of audio shared by neighbouring chunks
+            max_workers: Maximum number of chunks recognized at once
+        
+        Returns:
+            Transcribed text string, or None if transcription fails
+        """
+        if not Path(audio_file_path).exists():
+            logger.error(f"Audio file not found: {audio_file_path}")
+            return None
+        
+        pcm = _load_pcm(audio_file_path)
+        if pcm is None or len(pcm[0]) <= chunk_seconds * pcm[1]:
+            return self.transcribe_file(audio_file_path)
+        
+        samples, sample_rate = pcm
+        bounds = _split_points(samples, sample_rate, chunk_seconds)
+        pad = int(overlap * sample_rate)
+        chunks = [
+            samples[max(0, start - pad):min(len(samples), end + pad)]
+            for start, end in zip(bounds[:-1], bounds[1:])
+        ]
+        
+        def recognize(chunk):
+            try:
+                return self._recognize_google(sr.AudioData(chunk.tobytes(), sample_rate, 2))
+            except sr.UnknownValueError:
+                return ""
+        
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                texts = list(executor.map(recognize, chunks))
+        except sr.RequestError as e:
+            logger.error(f"API request error: {e}")
+            return None
+        except Exception as e:
+            logger.error(f"Transcription error: {e}")
+            return None
+        
+        words: List[str] = []
+        for text in texts:
+            words.extend(_trim_repeated_prefix(words, text.split()))
+        
+        if not words:
+            logger.warning(f"No speech detected in: {audio_file_path}")
+            return None
+        
+        logger.info(f"Transcribed {len(chunks)} chunks: {audio_file_path}")
+        return " ".join(words)
+    
+    def transcribe_with_timestamp(self, audio_file_path: str,
+                                  engine: str = "google") -> Optional[TranscriptionResult]:
         """
         Transcribe audio file and return result with metadata
         
         Args:
             audio_file_path: Path to the audio file
-            engine: Transcription engine ('google' or 'whisper')
+            engine: Transcription engine ('google', 'google_cloud' or 'whisper')
         
         Returns:
-            Dictionary with timestamp, audio file, and transcribed text
-            Example: {
-                "timestamp": "2025-11-07T14:30:05",
-                "audio_file": "path/to/audio.wav",
-                "text": "transcribed text here",
-                "language": "en-US",
-                "engine": "google"
-            }
+            TranscriptionResult with timestamp, audio file, and transcribed text
+            Example: TranscriptionResult(
+                timestamp="2025-11-07T14:30:05",
+                audio_file="path/to/audio.wav",
+                text="transcribed text here",
+                language="en-US",
+                engine="google"
+            )
         """
         text = self.transcribe_file(audio_file_path, engine)
         
         if text is None:
             return None
         
-        return {
-            "timestamp": datetime.now().isoformat(),
-            "audio_file": str(Path(audio_file_path).absolute()),
-            "text": text,
-            "language": self.language,
-            "engine": engine
-        }
+        return self._build_result(audio_file_path, text, engine)
+    
+    def _build_result(self, audio_file_path: str, text: str, engine: str) -> TranscriptionResult:
+        """
+        Wrap transcribed text with its metadata
+        
+        Args:
+            audio_file_path: Path to the audio file
+            text: Transcribed text
+            engine: Engine that produced the text
+        
+        Returns:
+            TranscriptionResult for the file
+        """
+        audio_file_path = os.fspath(audio_file_path)
+        if not os.path.isabs(audio_file_path):
+            audio_file_path = os.path.join(_CWD, audio_file_path)
+        
+        return TranscriptionResult(
+            timestamp=datetime.now().isoformat(),
+            audio_file=audio_file_path,
+            text=text,
+            language=self.language,
+            engine=engine
+        )
     
-    def batch_transcribe(self, audio_files: List[str], engine: str = "google") -> List[Dict]:
+    def batch_transcribe(self, audio_files: List[str], engine: str = "google",
+                         max_workers: int = 5,
+                         output_path: Optional[str] = None) -> List[TranscriptionResult]:
         """
-        Transcribe multiple audio files
+        Transcribe multiple audio files concurrently
         
         Args:
             audio_files: List of audio file paths
             engine: Transcription engine to use
+            max_workers: Maximum number of files transcribed at once
+            output_path: If given, stream each result to this NDJSON file as
+                it completes instead of collecting results in memory
         
         Returns:
-            List of transcription dictionaries
+            List of transcription results, in input order (empty when
+            output_path is given)
         """
-        results = []
         total = len(audio_files)
         
         logger.info(f"Starting batch transcription of {total} files...")
         
-        for idx, audio_file in enumerate(audio_files, 1):
-            logger.info(f"Processing file {idx}/{total}: {audio_file}")
-            result = self.transcribe_with_timestamp(audio_file, engine)
+        completed = None
+        if engine == "whisper" and self.whisper_available:
+            try:
+                backend, model = self._get_whisper_model(self.whisper_model_size)
+            except Exception as e:
+                # Leave it to the per-file path, which reports each file as failed
+                logger.error(f"Whisper model failed to load: {e}")
+                backend, model = None, None
+            if backend == "faster_whisper":
+                completed = self._batch_transcribe_faster_whisper(model, audio_files, max_workers)
+        if completed is None:
+            completed = self._batch_transcribe_pool(audio_files, engine, max_workers)
+        
+        ordered: List[Optional[TranscriptionResult]] = [None] * total
+        successful = 0
+        
+        out = open(output_path, 'wb', buffering=1 << 20) if output_path else None
+        try:
+            for idx, result in completed:
+                if result is None:
+                    logger.warning(f"Skipped file (no transcription): {audio_files[idx]}")
+                    continue
+                successful += 1
+                if out is not None:
+                    out.write(_dumps(result.to_dict()) + b"\n")
+                else:
+                    ordered[idx] = result
+        finally:
+            if out is not None:
+                out.close()
+        
+        logger.info(f"Batch transcription complete: {successful}/{total} successful")
+        return [result for result in ordered if result is not None]
+    
+    def _batch_transcribe_pool(self, audio_files: List[str], engine: str,
+                               max_workers: int) -> Iterator[Tuple[int, Optional[TranscriptionResult]]]:
+        """
+        Transcribe files on a thread pool, one file per task
+        
+        Args:
+            audio_files: List of audio file paths
+            engine: Transcription engine to use
+            max_workers: Maximum number of files transcribed at once
+        
+        Yields:
+            (input index, result or None) in completion order
+        """
+        total = len(audio_files)
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.transcribe_with_timestamp, audio_file, engine): idx
+                for idx, audio_file in enumerate(audio_files)
+            }
             
-            if result:
-                results.append(result)
-            else:
-                logger.warning(f"Skipped file (no transcription): {audio_file}")
+            for done, future in enumerate(as_completed(futures), 1):
+                idx = futures[future]
+                logger.info(f"Finished file {done}/{total}: {audio_files[idx]}")
+                yield idx, future.result()
+    
+    def _batch_transcribe_faster_whisper(self, model, audio_files: List[str],
+                                         max_workers: int) -> Iterator[Tuple[int, Optional[TranscriptionResult]]]:
+        """
+        Transcribe files through faster-whisper's batched pipeline
+        
+        Cached transcripts are returned without decoding. The rest are
+        decoded concurrently in windows of a few files per worker, and each
+        window is fed shortest first so consecutive calls have similar
+        lengths and little padding. Only one window of decoded audio is held
+        in memory at a time.
+        
+        Args:
+            model: Loaded faster_whisper WhisperModel
+            audio_files: List of audio file paths
+            max_workers: Maximum number of files decoded at once
+        
+        Yields:
+            (input index, result or None) in completion order
+        """
+        from faster_whisper import BatchedInferencePipeline
+        from faster_whisper.audio import decode_audio
+        
+        # Same cache key as transcribe_file(engine="whisper")
+        cache_engine = f"whisper-{self.whisper_model_size}"
+        
+        # (cache path, cached text, decoded audio); audio is only decoded on a miss
+        def prepare(audio_file):
+            cache_path = self._cache_path(audio_file, cache_engine)
+            if cache_path is not None:
+                text = self._cache_get(cache_path)
+                if text is not None:
+                    return cache_path, text, None
+            try:
+                return cache_path, None, decode_audio(audio_file)
+            except Exception as e:
+                logger.error(f"Could not decode {audio_file}: {e}")
+                return cache_path, None, None
+        
+        pipeline = BatchedInferencePipeline(model=model)
+        language = self.language.split('-')[0]
+        window = max(1, max_workers * WHISPER_DECODE_WINDOW_PER_WORKER)
+        total = len(audio_files)
+        done = 0
         
-        logger.info(f"Batch transcription complete: {len(results)}/{total} successful")
-        return results
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for start in range(0, total, window):
+                indices = range(start, min(start + window, total))
+                pending = []
+                for idx, (cache_path, cached_text, samples) in zip(
+                        indices, executor.map(prepare, audio_files[start:start + window])):
+                    if samples is not None:
+                        pending.append((len(samples), idx, cache_path, samples))
+                        continue
+                    done += 1
+                    if cached_text is not None:
+                        logger.info(f"Using cached transcription: {audio_files[idx]}")
+                        yield idx, self._build_result(audio_files[idx], cached_text, "whisper")
+                    else:
+                        yield idx, None
+                
+                pending.sort(key=lambda item: item[0])
+                while pending:
+                    _, idx, cache_path, samples = pending.pop(0)
+                    audio_file = audio_files[idx]
+                    try:
+                        segments, _ = pipeline.transcribe(
+                            samples, language=language, vad_filter=True,
+                            batch_size=WHISPER_BATCH_SIZE
+                        )
+                        text = " ".join(segment.text.strip() for segment in segments).strip()
+                    except Exception as e:
+                        logger.error(f"Whisper transcription error: {e}")
+                        text = ""
+                    # Release the samples before the consumer handles the result
+                    del samples
+                    
+                    if text and cache_path is not None:
+                        self._cache_put(cache_path, text)
+                    
+                    done += 1
+                    logger.info(f"Finished file {done}/{total}: {audio_file}")
+                    yield idx, self._build_result(audio_file, text, "whisper") if text else None
 
 
 # Example usage
@@ -219,10 +1149,10 @@ if __name__ == "__main__":
     result = recognizer.transcribe_with_timestamp(audio_file)
     if result:
         print(f"\nDetailed result:")
-        print(f"  Timestamp: {result['timestamp']}")
-        print(f"  Text: {result['text']}")
-        print(f"  Language: {result['language']}")
-        print(f"  Engine: {result['engine']}")
+        print(f"  Timestamp: {result.timestamp}")
+        print(f"  Text: {result.text}")
+        print(f"  Language: {result.language}")
+        print(f"  Engine: {result.engine}")
     
     # Change language
     recognizer.set_language("hi-IN")  # Hindi
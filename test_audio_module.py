@@ -1,197 +1,111 @@
 """
-Quick Test Script for Audio Logger Module
-Tests basic functionality without recording
+Tests for the Audio Logger Module
+Covers basic functionality without recording
 """
 
-import sys
-from pathlib import Path
+import functools
 
-def test_imports():
-    """Test if all required modules can be imported."""
-    print("Testing imports...")
-    try:
-        import pyaudio
-        print("✅ PyAudio imported successfully")
-    except ImportError as e:
-        print(f"❌ PyAudio import failed: {e}")
-        return False
-    
-    try:
-        import speech_recognition as sr
-        print("✅ SpeechRecognition imported successfully")
-    except ImportError as e:
-        print(f"❌ SpeechRecognition import failed: {e}")
-        return False
-    
-    try:
-        from audio_logger import AudioToTextLogger
-        print("✅ AudioToTextLogger imported successfully")
-    except ImportError as e:
-        print(f"❌ AudioToTextLogger import failed: {e}")
-        return False
-    
-    return True
+import pytest
 
+from conftest import probe_imports
 
-def test_audio_devices():
-    """Test if audio input devices are available."""
-    print("\nTesting audio devices...")
+
+@functools.lru_cache(maxsize=1)
+def _enumerate_devices():
+    """
+    Query PortAudio for all devices once per run.
+    
+    Returns:
+        tuple: (list of device info dicts, default input device info or the
+        error raised looking it up)
+    """
+    import pyaudio
+    p = pyaudio.PyAudio()
     try:
-        import pyaudio
-        p = pyaudio.PyAudio()
-        
-        device_count = p.get_device_count()
-        print(f"✅ Found {device_count} audio devices")
-        
-        # List input devices
-        input_devices = []
-        for i in range(device_count):
-            info = p.get_device_info_by_index(i)
-            if info['maxInputChannels'] > 0:
-                input_devices.append(info)
-                print(f"   📍 Input Device {i}: {info['name']}")
-        
-        if not input_devices:
-            print("⚠️  No input devices found! Check microphone connection.")
-            return False
-        
-        # Check default input device
+        devices = [p.get_device_info_by_index(i) for i in range(p.get_device_count())]
         try:
-            default_info = p.get_default_input_device_info()
-            print(f"\n✅ Default input device: {default_info['name']}")
+            default_input = p.get_default_input_device_info()
         except Exception as e:
-            print(f"⚠️  No default input device: {e}")
-        
+            default_input = e
+        return devices, default_input
+    finally:
         p.terminate()
-        return len(input_devices) > 0
-        
-    except Exception as e:
-        print(f"❌ Audio device test failed: {e}")
-        return False
 
 
-def test_logger_initialization():
-    """Test if AudioLogger can be initialized."""
-    print("\nTesting AudioToTextLogger initialization...")
-    try:
-        from audio_logger import AudioToTextLogger
-        
-        logger = AudioToTextLogger(
-            audio_dir="logs/audio",
-            transcript_dir="logs/transcripts",
-            engine="google"
-        )
-        print("✅ AudioToTextLogger initialized successfully")
-        
-        info = logger.get_session_info()
-        print(f"   Session ID: {info['session_id']}")
-        print(f"   Recording: {info['is_recording']}")
-        print(f"   Engine: {info['engine']}")
-        print(f"   Sample Rate: {info['sample_rate']} Hz")
-        
-        return True
-    except Exception as e:
-        print(f"❌ Initialization failed: {e}")
-        return False
-
-
-def test_directory_structure():
-    """Test if required directories exist."""
-    print("\nTesting directory structure...")
-    
-    audio_dir = Path("logs/audio")
-    transcript_dir = Path("logs/transcripts")
-    
-    if audio_dir.exists():
-        print(f"✅ Audio directory exists: {audio_dir}")
-    else:
-        print(f"⚠️  Audio directory not found: {audio_dir}")
-    
-    if transcript_dir.exists():
-        print(f"✅ Transcript directory exists: {transcript_dir}")
-    else:
-        print(f"⚠️  Transcript directory not found: {transcript_dir}")
-    
-    return audio_dir.exists() and transcript_dir.exists()
+@pytest.fixture
+def logger_class():
+    """AudioToTextLogger, skipping when PyAudio is not installed."""
+    pytest.importorskip("pyaudio")
+    from audio_logger import AudioToTextLogger
+    return AudioToTextLogger
 
 
-def test_session_management():
-    """Test session listing and management."""
-    print("\nTesting session management...")
-    try:
-        from audio_logger import AudioToTextLogger
-        
-        logger = AudioToTextLogger()
-        sessions = logger.list_sessions()
-        
-        print(f"✅ Found {len(sessions)} existing sessions")
-        if sessions:
-            print("   Recent sessions:")
-            for session in sessions[:3]:
-                print(f"   - {session}")
-        
-        return True
-    except Exception as e:
-        print(f"❌ Session management test failed: {e}")
-        return False
-
-
-def main():
-    """Run all tests."""
-    print("=" * 60)
-    print("Audio Logger Module - System Test")
-    print("=" * 60)
-    print()
+def test_imports():
+    """Test if all required modules can be imported."""
+    required = {'speech_recognition': 'SpeechRecognition'}
+    # Need PortAudio, which headless machines may not have
+    optional = {'pyaudio': 'PyAudio', 'audio_logger': 'AudioToTextLogger'}
     
-    tests = [
-        ("Import Test", test_imports),
-        ("Audio Devices Test", test_audio_devices),
-        ("Directory Structure Test", test_directory_structure),
-        ("Logger Initialization Test", test_logger_initialization),
-        ("Session Management Test", test_session_management),
-    ]
+    results = probe_imports(list(required) + list(optional))
     
-    results = []
-    for test_name, test_func in tests:
-        try:
-            result = test_func()
-            results.append((test_name, result))
-        except Exception as e:
-            print(f"❌ {test_name} crashed: {e}")
-            results.append((test_name, False))
-        print()
+    failures = [f"{required[module]}: {error}" for module, ok, error in results
+                if module in required and not ok]
+    assert not failures, ("Missing dependencies (run: pip install -r requirements_audio.txt): "
+                          + "; ".join(failures))
     
-    # Summary
-    print("=" * 60)
-    print("Test Summary")
-    print("=" * 60)
+    skipped = [f"{optional[module]}: {error}" for module, ok, error in results
+               if module in optional and not ok]
+    if skipped:
+        pytest.skip("Missing optional dependencies: " + "; ".join(skipped))
+
+
+def test_audio_devices():
+    """Test if audio input devices are available."""
+    pytest.importorskip("pyaudio")
+    devices, default_input = _enumerate_devices()
     
-    passed = sum(1 for _, result in results if result)
-    total = len(results)
+    input_devices = [info for info in devices if info['maxInputChannels'] > 0]
+    if not input_devices:
+        pytest.skip("No input devices found! Check microphone connection.")
     
-    for test_name, result in results:
-        status = "✅ PASS" if result else "❌ FAIL"
-        print(f"{status} - {test_name}")
+    # A missing default input device is tolerated; a wrong one is not
+    if not isinstance(default_input, Exception):
+        assert default_input['maxInputChannels'] > 0
+
+
+def test_directory_structure(logger_class, tmp_path):
+    """Test if the logger creates its output directories."""
+    audio_dir = tmp_path / "logs" / "audio"
+    transcript_dir = tmp_path / "logs" / "transcripts"
     
-    print()
-    print(f"Results: {passed}/{total} tests passed")
+    logger_class(audio_dir=str(audio_dir), transcript_dir=str(transcript_dir))
     
-    if passed == total:
-        print("\n🎉 All tests passed! Audio logger is ready to use.")
-        print("\nNext steps:")
-        print("1. Run 'python audio_integration.py' for interactive demo")
-        print("2. Run 'python audio_web_api.py' for web interface")
-        print("3. Check AUDIO_MODULE_README.md for full documentation")
-    else:
-        print("\n⚠️  Some tests failed. Please check the errors above.")
-        print("Common issues:")
-        print("- No microphone connected or permissions not granted")
-        print("- Audio drivers not installed properly")
-        print("- Missing dependencies (run: pip install -r requirements_audio.txt)")
+    assert audio_dir.is_dir()
+    assert transcript_dir.is_dir()
+
+
+def test_logger_initialization(logger_class, tmp_path):
+    """Test if AudioLogger can be initialized."""
+    logger = logger_class(
+        audio_dir=str(tmp_path / "audio"),
+        transcript_dir=str(tmp_path / "transcripts"),
+        engine="google"
+    )
     
-    return passed == total
+    info = logger.get_session_info()
+    assert info['session_id'] is None
+    assert info['is_recording'] is False
+    assert info['engine'] == "google"
+    assert info['sample_rate'] == 16000
 
 
-if __name__ == "__main__":
-    success = main()
-    sys.exit(0 if success else 1)
+def test_session_management(logger_class, tmp_path):
+    """Test session listing and management."""
+    transcript_dir = tmp_path / "transcripts"
+    transcript_dir.mkdir()
+    for session_id in ("20250101_090000", "20250102_090000"):
+        (transcript_dir / f"session_{session_id}.json").write_text("{}")
+    
+    logger = logger_class(audio_dir=str(tmp_path / "audio"), transcript_dir=str(transcript_dir))
+    
+    assert logger.list_sessions() == ["20250102_090000", "20250101_090000"]
@@ -1,38 +1,304 @@
 """
 Transcript Manager Module
-Manages transcripts using JSON files (no database required)
+Manages transcripts using JSON Lines files (no database required)
 """
 
+import atexit
 import json
+import mmap
+import os
+import re
+import shutil
+import threading
+import time
+import weakref
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from pathlib import Path
-from typing import List, Dict, Optional
-from datetime import datetime
+from typing import Callable, Iterator, List, Dict, Optional, Sequence, Tuple
 import logging
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Buffer size for session file I/O; coalesces reads and writes into few syscalls
+IO_BUFFER_SIZE = 1 << 16
+
+# Parsed sessions kept in memory per manager, least recently used evicted first
+SESSION_CACHE_MAX_ENTRIES = 128
+
+# Session files at least this large are memory-mapped and checked for any keyword before parsing
+MMAP_PREFILTER_MIN_BYTES = 1 << 16
+
+# Session IDs generated from a local timestamp, e.g. 20251107_143000
+_TIMESTAMP_SESSION_ID = re.compile(r"(\d{4})(\d{2})(\d{2})_(\d{2})(\d{2})(\d{2})")
+
+# Upper bound on session files searched concurrently by search_keywords
+SEARCH_MAX_WORKERS = os.cpu_count() or 4
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+    _dumps = orjson.dumps
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _build_automaton(keywords_list: Sequence[str]):
+    """
+    Build one Aho-Corasick automaton matching any of the keywords
+    
+    Args:
+        keywords_list: Lowercased keywords to search for
+    
+    Returns:
+        pyahocorasick Automaton, or None if pyahocorasick is not installed or
+        the keywords cannot be put in an automaton (none, or an empty one)
+    """
+    if ahocorasick is None or not keywords_list or not all(keywords_list):
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords_list:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+def _escaped_in_json(keyword: str) -> bool:
+    """
+    Check whether a keyword would appear escaped inside a JSON string
+    
+    Args:
+        keyword: Keyword to check
+    
+    Returns:
+        True if the raw JSON text may not contain the keyword verbatim
+    """
+    return any(ch in '"\\' or ch < ' ' for ch in keyword)
+
+
+def _read_json_file(path: Path) -> Optional[Dict]:
+    """
+    Read a small JSON document in one buffered call
+    
+    Args:
+        path: File to read
+    
+    Returns:
+        Parsed document, or None if the file is missing or unreadable
+    """
+    try:
+        with open(path, 'rb', buffering=IO_BUFFER_SIZE) as f:
+            return json.loads(f.read().decode('utf-8'))
+    except FileNotFoundError:
+        return None
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        logger.error(f"Error reading {path}: {e}")
+        return None
+
+
+def _word_count(text: str) -> int:
+    """
+    Count the words of a transcript without splitting it into a list
+    
+    Recognizer output is single-spaced with no leading or trailing blanks,
+    so the word count is one more than the number of spaces.
+    
+    Args:
+        text: Transcript text
+    
+    Returns:
+        Number of words
+    """
+    return text.count(' ') + 1 if text else 0
+
+
+def _text_totals(texts: Sequence[str]) -> Dict:
+    """
+    Count transcripts, characters and words
+    
+    Args:
+        texts: Transcript texts
+    
+    Returns:
+        Dictionary with total_transcripts, total_characters and total_words
+    """
+    return {
+        "total_transcripts": len(texts),
+        "total_characters": sum(map(len, texts)),
+        "total_words": sum(map(_word_count, texts))
+    }
+
+
+# Managers with transcripts possibly still queued; weak so exit flushing never keeps one alive
+_live_managers: "weakref.WeakSet[TranscriptManager]" = weakref.WeakSet()
+
+
+def _flush_live_managers():
+    """
+    Write queued transcripts of every manager still alive at interpreter exit
+    """
+    for manager in list(_live_managers):
+        manager.close()
+
+
+atexit.register(_flush_live_managers)
+
+
+# Marks a field an entry did not have, so rebuilt rows match what was saved
+_MISSING = object()
+
+
+class _SessionColumns:
+    """
+    A parsed session held column-wise instead of as one dict per transcript
+    
+    Keyword searches and statistics walk the texts column alone and only
+    build dictionaries for the entries they return.
+    """
+    
+    __slots__ = ("timestamps", "audio_files", "texts", "extras")
+    
+    def __init__(self, entries=()):
+        self.timestamps: List = []
+        self.audio_files: List = []
+        self.texts: List[str] = []
+        self.extras: List[Dict] = []
+        self.extend(entries)
+    
+    def __len__(self) -> int:
+        return len(self.texts)
+    
+    def extend(self, entries):
+        """
+        Add transcript entries as new rows
+        
+        Args:
+            entries: Transcript dictionaries
+        """
+        for entry in entries:
+            extra = dict(entry)
+            self.timestamps.append(extra.pop("timestamp", _MISSING))
+            self.audio_files.append(extra.pop("audio_file", _MISSING))
+            self.extras.append(extra)
+            # Appended last, so a concurrent reader of texts always finds the whole row
+            self.texts.append(extra.pop("text", ""))
+    
+    def row(self, index: int) -> Dict:
+        """
+        Rebuild one transcript dictionary
+        
+        Args:
+            index: Row number
+        
+        Returns:
+            New transcript dictionary
+        """
+        entry = {}
+        if self.timestamps[index] is not _MISSING:
+            entry["timestamp"] = self.timestamps[index]
+        if self.audio_files[index] is not _MISSING:
+            entry["audio_file"] = self.audio_files[index]
+        entry["text"] = self.texts[index]
+        entry.update(self.extras[index])
+        return entry
+    
+    def rows(self) -> List[Dict]:
+        """
+        Rebuild every transcript dictionary
+        
+        Returns:
+            List of new transcript dictionaries
+        """
+        return [self.row(index) for index in range(len(self.texts))]
+
+
+def _write_atomic(path: Path, data: bytes, sync: bool = True):
+    """
+    Replace a file's contents without ever exposing a partial write
+    
+    The data is synced to disk before the rename, so after a crash the file
+    holds either the old or the new contents in full.
+    
+    Args:
+        path: File to write
+        data: Complete new contents
+        sync: Whether to fsync; skip it for files that can be rebuilt
+    """
+    # Per-writer temp name, so concurrent writes of one file never share it
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp_path, 'wb', buffering=IO_BUFFER_SIZE) as f:
+            f.write(data)
+            if sync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
 
 class TranscriptManager:
     """
-    Manages audio transcripts using JSON file storage
+    Manages audio transcripts using JSON Lines file storage
+    
+    Each session keeps its transcripts in session_<id>.jsonl, one entry per
+    line, so saving a transcript appends instead of rewriting the session.
+    The session header lives next to it in session_<id>.meta.json. Sessions
+    written as a single session_<id>.json document are still read.
     """
     
-    def __init__(self, base_dir: str = "logs/transcripts"):
+    def __init__(self, base_dir: str = "logs/transcripts", flush_interval: float = 1.0,
+                 max_pending: int = 64, verbose: bool = False):
         """
         Initialize the transcript manager
         
         Args:
-            base_dir: Base directory for storing transcript JSON files
+            base_dir: Base directory for storing transcript files
+            flush_interval: Seconds saved transcripts may wait before being
+                written in one batch (0 writes every transcript immediately)
+            max_pending: Queued transcripts per session that trigger an
+                immediate write
+            verbose: Log every saved transcript at INFO instead of DEBUG
         """
         self.base_dir = Path(base_dir)
         self.base_dir.mkdir(parents=True, exist_ok=True)
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.verbose = verbose
+        
+        # Relative audio paths are resolved against the directory at startup
+        self._cwd = os.getcwd()
+        
+        # Session file -> (st_mtime_ns, st_size, parsed transcript columns)
+        self._session_cache: "OrderedDict[Path, Tuple[int, int, _SessionColumns]]" = OrderedDict()
+        self._session_cache_lock = threading.Lock()
+        
+        # Transcripts saved but not yet written, per session
+        self._pending: Dict[str, List[Dict]] = defaultdict(list)
+        self._pending_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._flush_timer: Optional[threading.Timer] = None
+        _live_managers.add(self)
         logger.info(f"TranscriptManager initialized. Storage: {self.base_dir}")
     
     def _get_session_file(self, session_id: str) -> Path:
         """
-        Get the JSON file path for a session
+        Get the legacy single-document JSON file path for a session
         
         Args:
             session_id: Session identifier
@@ -42,9 +308,247 @@ class TranscriptManager:
         """
         return self.base_dir / f"session_{session_id}.json"
     
+    def _session_jsonl_path(self, session_id: str) -> Path:
+        """
+        Get the JSON Lines file path holding a session's transcripts
+        
+        Args:
+            session_id: Session identifier
+        
+        Returns:
+            Path to session JSONL file
+        """
+        return self.base_dir / f"session_{session_id}.jsonl"
+    
+    def _session_meta_path(self, session_id: str) -> Path:
+        """
+        Get the metadata file path holding a session's header fields
+        
+        Args:
+            session_id: Session identifier
+        
+        Returns:
+            Path to session metadata JSON file
+        """
+        return self.base_dir / f"session_{session_id}.meta.json"
+    
+    def _session_stats_path(self, session_id: str) -> Path:
+        """
+        Get the sidecar file path holding a session's running statistics
+        
+        Args:
+            session_id: Session identifier
+        
+        Returns:
+            Path to session statistics JSON file
+        """
+        return self.base_dir / f"session_{session_id}.stats.json"
+    
+    def _write_stats(self, session_id: str, stats: Dict):
+        """
+        Store a session's running statistics next to its JSONL file
+        
+        The sidecar records the JSONL size it describes and is ignored once
+        the file no longer has that size, so losing a write only costs a
+        recount.
+        
+        Args:
+            session_id: Session identifier
+            stats: Totals plus the matching "jsonl_size"
+        """
+        try:
+            _write_atomic(self._session_stats_path(session_id), _dumps(stats), sync=False)
+        except OSError as e:
+            logger.error(f"Error saving stats for session {session_id}: {e}")
+    
+    def _load_legacy_session(self, session_id: str) -> Optional[Dict]:
+        """
+        Load a session stored as a single JSON document
+        
+        Args:
+            session_id: Session identifier
+        
+        Returns:
+            Session dictionary, or None if there is no legacy file
+        """
+        session_file = self._get_session_file(session_id)
+        
+        if not session_file.exists():
+            return None
+        
+        try:
+            with open(session_file, 'rb', buffering=IO_BUFFER_SIZE) as f:
+                return json.loads(f.read().decode('utf-8'))
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            logger.error(f"Error loading session {session_id}: {e}")
+            return None
+    
+    def _iter_legacy_transcripts(self, session_id: str) -> Iterator[Dict]:
+        """
+        Stream the transcript entries of a legacy single-document session
+        
+        Uses ijson when installed so the document is never held in memory
+        all at once.
+        
+        Args:
+            session_id: Session identifier
+        
+        Yields:
+            Transcript dictionaries
+        """
+        if ijson is None:
+            legacy = self._load_legacy_session(session_id)
+            if legacy is not None:
+                yield from legacy.get("transcripts", [])
+            return
+        
+        session_file = self._get_session_file(session_id)
+        if not session_file.exists():
+            return
+        
+        try:
+            with open(session_file, 'rb', buffering=IO_BUFFER_SIZE) as f:
+                yield from ijson.items(f, 'transcripts.item', use_float=True)
+        except ijson.JSONError as e:
+            logger.error(f"Error loading session {session_id}: {e}")
+    
+    def _iter_transcripts(self, session_id: str,
+                          line_filter: Optional[Callable[[bytes], bool]] = None) -> Iterator[Dict]:
+        """
+        Stream the transcript entries of a session in the order they were saved
+        
+        Args:
+            session_id: Session identifier
+            line_filter: Optional test on each raw JSONL line; lines it rejects
+                are skipped without being parsed
+        
+        Yields:
+            Transcript dictionaries
+        """
+        jsonl_file = self._session_jsonl_path(session_id)
+        
+        if not jsonl_file.exists():
+            yield from self._iter_legacy_transcripts(session_id)
+            return
+        
+        with open(jsonl_file, 'rb', buffering=IO_BUFFER_SIZE) as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                if line_filter is not None and not line_filter(line):
+                    continue
+                try:
+                    yield json.loads(line)
+                except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                    # A crash mid-append leaves at most one torn line; skip it
+                    logger.error(f"Skipping bad line {line_number} in {jsonl_file}: {e}")
+    
+    def _session_source(self, session_id: str) -> Optional[Path]:
+        """
+        Find the file a session's transcripts are read from
+        
+        Args:
+            session_id: Session identifier
+        
+        Returns:
+            The JSONL file, else the legacy JSON file, or None if neither exists
+        """
+        for path in (self._session_jsonl_path(session_id), self._get_session_file(session_id)):
+            if path.exists():
+                return path
+        return None
+    
+    def _cache_store(self, path: Path, st: os.stat_result, columns: _SessionColumns):
+        """
+        Remember parsed transcripts for a session file
+        
+        Args:
+            path: Session file the transcripts came from
+            st: Stat of the file matching the transcripts
+            columns: Parsed transcript columns
+        """
+        with self._session_cache_lock:
+            self._session_cache[path] = (st.st_mtime_ns, st.st_size, columns)
+            self._session_cache.move_to_end(path)
+            while len(self._session_cache) > SESSION_CACHE_MAX_ENTRIES:
+                self._session_cache.popitem(last=False)
+    
+    def _cached_columns(self, session_id: str) -> Tuple[Optional[_SessionColumns], Optional[Path], Optional[os.stat_result]]:
+        """
+        Look up a session's parsed transcripts in the cache
+        
+        Args:
+            session_id: Session identifier
+        
+        Returns:
+            Tuple of (cached columns or None, session file or None, its stat)
+        """
+        path = self._session_source(session_id)
+        if path is None:
+            return None, None, None
+        
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return None, None, None
+        
+        with self._session_cache_lock:
+            entry = self._session_cache.get(path)
+            if entry is not None and entry[:2] == (st.st_mtime_ns, st.st_size):
+                self._session_cache.move_to_end(path)
+                return entry[2], path, st
+        return None, path, st
+    
+    def _read_columns(self, session_id: str) -> _SessionColumns:
+        """
+        Get a session's parsed transcripts, reusing them until the file changes
+        
+        The returned columns are shared with the cache and must not be modified.
+        
+        Args:
+            session_id: Session identifier
+        
+        Returns:
+            Transcript columns
+        """
+        columns, path, st = self._cached_columns(session_id)
+        if columns is not None:
+            return columns
+        if path is None:
+            return _SessionColumns()
+        
+        columns = _SessionColumns(self._iter_transcripts(session_id))
+        
+        # Keyed by the stat taken before parsing, so a concurrent write forces a re-read
+        self._cache_store(path, st, columns)
+        return columns
+    
+    def _load_meta(self, session_id: str) -> Dict:
+        """
+        Load a session's header fields without its transcripts
+        
+        Args:
+            session_id: Session identifier
+        
+        Returns:
+            Dictionary with session_id, created_at and any other header fields
+        """
+        meta_file = self._session_meta_path(session_id)
+        
+        if not meta_file.exists():
+            legacy = self._load_legacy_session(session_id)
+            if legacy is not None:
+                legacy.pop("transcripts", None)
+                return legacy
+        
+        meta = self._create_new_session(session_id)
+        del meta["transcripts"]
+        meta.update(_read_json_file(meta_file) or {})
+        return meta
+    
     def _load_session(self, session_id: str) -> Dict:
         """
-        Load session data from JSON file
+        Load session data from its metadata and JSONL files
         
         Args:
             session_id: Session identifier
@@ -57,17 +561,9 @@ class TranscriptManager:
                 "transcripts": [...]
             }
         """
-        session_file = self._get_session_file(session_id)
-        
-        if session_file.exists():
-            try:
-                with open(session_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except json.JSONDecodeError as e:
-                logger.error(f"Error loading session {session_id}: {e}")
-                return self._create_new_session(session_id)
-        else:
-            return self._create_new_session(session_id)
+        session_data = self._load_meta(session_id)
+        session_data["transcripts"] = self._read_columns(session_id).rows()
+        return session_data
     
     def _create_new_session(self, session_id: str) -> Dict:
         """
@@ -79,26 +575,46 @@ class TranscriptManager:
         Returns:
             New session dictionary
         """
+        # Timestamped IDs already say when the session started
+        match = _TIMESTAMP_SESSION_ID.fullmatch(session_id)
+        if match:
+            created_at = "{}-{}-{}T{}:{}:{}".format(*match.groups())
+        else:
+            now = time.time()
+            created_at = (time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(now))
+                          + f".{int(now * 1e6) % 1_000_000:06d}")
+        
         return {
             "session_id": session_id,
-            "created_at": datetime.now().isoformat(),
+            "created_at": created_at,
             "transcripts": []
         }
     
     def _save_session(self, session_data: Dict):
         """
-        Save session data to JSON file
+        Write a whole session out as its metadata and JSONL files
+        
+        Only needed when a session is first created or converted from the
+        legacy format; new transcripts are appended by save_transcript.
         
         Args:
             session_data: Session dictionary to save
         """
         session_id = session_data["session_id"]
-        session_file = self._get_session_file(session_id)
+        meta = {key: value for key, value in session_data.items() if key != "transcripts"}
+        
+        transcripts = session_data.get("transcripts", [])
+        jsonl_file = self._session_jsonl_path(session_id)
         
         try:
-            with open(session_file, 'w', encoding='utf-8') as f:
-                json.dump(session_data, f, indent=2, ensure_ascii=False)
-            logger.info(f"Session saved: {session_id}")
+            lines = b"".join(_dumps(transcript) + b"\n" for transcript in transcripts)
+            _write_atomic(jsonl_file, lines)
+            _write_atomic(self._session_meta_path(session_id), _dumps(meta))
+            st = jsonl_file.stat()
+            columns = _SessionColumns(transcripts)
+            self._cache_store(jsonl_file, st, columns)
+            self._write_stats(session_id, {"jsonl_size": st.st_size, **_text_totals(columns.texts)})
+            logger.debug(f"Session saved: {session_id}")
         except Exception as e:
             logger.error(f"Error saving session {session_id}: {e}")
             raise
@@ -114,19 +630,132 @@ class TranscriptManager:
             text: Transcribed text
             **metadata: Additional metadata (language, engine, etc.)
         """
-        session_data = self._load_session(session_id)
-        
+        audio_file = os.fspath(audio_file)
         transcript_entry = {
             "timestamp": timestamp,
-            "audio_file": str(Path(audio_file).absolute()),
+            "audio_file": audio_file if os.path.isabs(audio_file) else os.path.join(self._cwd, audio_file),
             "text": text,
             **metadata
         }
         
-        session_data["transcripts"].append(transcript_entry)
-        self._save_session(session_data)
+        # Queue the entry; it is written to disk together with the rest of its batch
+        with self._pending_lock:
+            pending = self._pending[session_id]
+            pending.append(transcript_entry)
+            flush_now = self.flush_interval <= 0 or len(pending) >= self.max_pending
+            if not flush_now and self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.flush_interval, self._flush_on_timer)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
         
-        logger.info(f"Transcript added to session {session_id}: {len(text)} characters")
+        if flush_now:
+            self._flush_session(session_id)
+        
+        # Per-save logging is opt-in; skip building the message when it is filtered out
+        level = logging.INFO if self.verbose else logging.DEBUG
+        if logger.isEnabledFor(level):
+            logger.log(level, f"Transcript added to session {session_id}: {len(text)} characters")
+    
+    def _append_entries(self, session_id: str, entries: List[Dict]):
+        """
+        Append transcript entries to a session's JSONL file and sync it to disk
+        
+        Args:
+            session_id: Session identifier
+            entries: Transcript entries in the order they were saved
+        """
+        # Create the session files, carrying over a legacy session if present
+        jsonl_file = self._session_jsonl_path(session_id)
+        if not (self._session_meta_path(session_id).exists() and jsonl_file.exists()):
+            self._save_session(self._load_session(session_id))
+        
+        # Append the batch instead of rewriting every earlier transcript
+        lines = [_dumps(entry) + b"\n" for entry in entries]
+        before = jsonl_file.stat()
+        with open(jsonl_file, 'ab+', buffering=IO_BUFFER_SIZE) as f:
+            # Terminate a line left torn by a crash so this batch stays intact
+            if f.tell() > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    lines[0] = b"\n" + lines[0]
+            f.writelines(lines)
+            f.flush()
+            os.fsync(f.fileno())
+        after = jsonl_file.stat()
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Wrote {len(entries)} transcripts to session {session_id}")
+        
+        # Nothing else wrote to the file meanwhile, so derived data can be extended
+        if after.st_size != before.st_size + sum(map(len, lines)):
+            return
+        
+        # Extend a cached copy in place
+        with self._session_cache_lock:
+            entry = self._session_cache.get(jsonl_file)
+            if entry is not None and entry[:2] == (before.st_mtime_ns, before.st_size):
+                entry[2].extend(entries)
+                self._session_cache[jsonl_file] = (after.st_mtime_ns, after.st_size, entry[2])
+        
+        # Add the batch to the statistics sidecar if it described the file before it
+        stats = _read_json_file(self._session_stats_path(session_id))
+        if stats is not None and stats.get("jsonl_size") == before.st_size:
+            for key, value in _text_totals([entry.get("text", "") for entry in entries]).items():
+                stats[key] = stats.get(key, 0) + value
+            stats["jsonl_size"] = after.st_size
+            self._write_stats(session_id, stats)
+    
+    def _flush_session(self, session_id: str):
+        """
+        Write the queued transcripts of one session to disk
+        
+        Args:
+            session_id: Session identifier
+        """
+        # Held across the write so batches of a session land in order
+        with self._flush_lock:
+            with self._pending_lock:
+                entries = self._pending.pop(session_id, None)
+            if not entries:
+                return
+            
+            try:
+                self._append_entries(session_id, entries)
+            except Exception as e:
+                logger.error(f"Error saving transcripts to session {session_id}: {e}")
+                with self._pending_lock:
+                    self._pending[session_id][:0] = entries
+                raise
+    
+    def _flush_on_timer(self):
+        """Flush all sessions when the batch interval elapses."""
+        with self._pending_lock:
+            self._flush_timer = None
+        try:
+            self.flush_all()
+        except Exception:
+            # Already logged; the entries stay queued for the next flush
+            pass
+    
+    def flush_all(self):
+        """
+        Write every queued transcript to disk
+        """
+        with self._pending_lock:
+            session_ids = list(self._pending)
+        
+        for session_id in session_ids:
+            self._flush_session(session_id)
+    
+    def close(self):
+        """
+        Stop the batch timer and write every queued transcript to disk
+        """
+        with self._pending_lock:
+            timer, self._flush_timer = self._flush_timer, None
+        if timer is not None:
+            timer.cancel()
+        self.flush_all()
     
     def get_transcripts(self, session_id: str) -> List[Dict]:
         """
@@ -138,8 +767,8 @@ class TranscriptManager:
         Returns:
             List of transcript dictionaries
         """
-        session_data = self._load_session(session_id)
-        return session_data.get("transcripts", [])
+        self._flush_session(session_id)
+        return self._read_columns(session_id).rows()
     
     def search_keywords(self, keywords_list: List[str], session_id: Optional[str] = None) -> List[Dict]:
         """
@@ -152,39 +781,148 @@ class TranscriptManager:
         Returns:
             List of matching transcript entries with session info
         """
-        matching_entries = []
+        # Lowercase the keywords once rather than per transcript
+        keywords_lower = tuple(keyword.lower() for keyword in keywords_list)
+        
+        # One pass per transcript finds any keyword, instead of one scan per keyword:
+        # an Aho-Corasick automaton when available, else one fused regex alternation
+        automaton = _build_automaton(keywords_lower)
+        text_pattern = None
+        if automaton is None and keywords_lower:
+            text_pattern = re.compile("|".join(map(re.escape, keywords_lower)), re.IGNORECASE)
+        
+        def contains_keyword(text: str) -> bool:
+            if automaton is not None:
+                return next(automaton.iter(text.lower()), None) is not None
+            return text_pattern is not None and text_pattern.search(text) is not None
+        
+        # A raw JSONL line without any keyword cannot hold a matching transcript
+        line_filter = None
+        file_pattern = None
+        if not any(_escaped_in_json(keyword) for keyword in keywords_lower):
+            def line_filter(line: bytes) -> bool:
+                return contains_keyword(line.decode('utf-8', 'replace'))
+            
+            # Bytes patterns only fold ASCII case, so whole files are prefiltered for ASCII keywords only
+            if keywords_lower and all(keyword.isascii() for keyword in keywords_lower):
+                file_pattern = re.compile(
+                    b"|".join(re.escape(keyword.encode('ascii')) for keyword in keywords_lower),
+                    re.IGNORECASE
+                )
         
         # Determine which sessions to search
         if session_id:
-            session_files = [self._get_session_file(session_id)]
+            self._flush_session(session_id)
+            session_ids = [session_id]
+        else:
+            session_ids = self.list_sessions()
+        
+        # Search sessions side by side; results keep the session order
+        if len(session_ids) > 1:
+            workers = min(SEARCH_MAX_WORKERS, len(session_ids))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                per_session = list(executor.map(
+                    lambda current_id: self._search_session(current_id, contains_keyword, line_filter, file_pattern),
+                    session_ids
+                ))
         else:
-            session_files = list(self.base_dir.glob("session_*.json"))
+            per_session = [self._search_session(current_id, contains_keyword, line_filter, file_pattern)
+                           for current_id in session_ids]
         
-        # Search through sessions
-        for session_file in session_files:
-            if not session_file.exists():
-                continue
+        matching_entries = list(chain.from_iterable(per_session))
+        
+        logger.info(f"Found {len(matching_entries)} transcripts matching keywords: {keywords_list}")
+        return matching_entries
+    
+    def _mapped_candidates(self, session_id: str, file_pattern: "re.Pattern[bytes]") -> Optional[List[Dict]]:
+        """
+        Parse only the entries of a large session file that mention a keyword
+        
+        The file is memory-mapped, so the kernel pages it in as the regex
+        engine scans the raw bytes. For a JSONL file each hit is widened to
+        its line and only those lines are parsed; the rest of the file is
+        never copied or decoded.
+        
+        Args:
+            session_id: Session identifier
+            file_pattern: Case-insensitive bytes pattern matching any keyword
+        
+        Returns:
+            Candidate transcript dictionaries (empty if the file has no hit),
+            or None if the file should be read the regular way
+        """
+        path = self._session_source(session_id)
+        if path is None:
+            return []
+        
+        try:
+            if path.stat().st_size < MMAP_PREFILTER_MIN_BYTES:
+                return None
             
-            try:
-                with open(session_file, 'r', encoding='utf-8') as f:
-                    session_data = json.load(f)
+            with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                match = file_pattern.search(mm)
+                if match is None:
+                    return []
+                if path.suffix != ".jsonl":
+                    # A legacy document has to be parsed whole
+                    return None
                 
-                # Check each transcript
-                for transcript in session_data.get("transcripts", []):
-                    text = transcript.get("text", "").lower()
+                candidates = []
+                while match is not None:
+                    start = mm.rfind(b"\n", 0, match.start()) + 1
+                    end = mm.find(b"\n", match.end())
+                    if end == -1:
+                        end = len(mm)
                     
-                    # Check if any keyword matches
-                    if any(keyword.lower() in text for keyword in keywords_list):
-                        # Add session info to result
-                        result = transcript.copy()
-                        result["session_id"] = session_data["session_id"]
-                        matching_entries.append(result)
-            
-            except json.JSONDecodeError as e:
-                logger.error(f"Error reading session file {session_file}: {e}")
-                continue
+                    try:
+                        candidates.append(json.loads(mm[start:end]))
+                    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                        logger.error(f"Skipping bad line at byte {start} in {path}: {e}")
+                    
+                    # Resume after this line so each entry is parsed once
+                    match = file_pattern.search(mm, end)
+                return candidates
+        except (OSError, ValueError):
+            # Let the regular read report the problem
+            return None
+    
+    def _search_session(self, session_id: str, contains_keyword: Callable[[str], bool],
+                        line_filter: Optional[Callable[[bytes], bool]],
+                        file_pattern: Optional["re.Pattern[bytes]"] = None) -> List[Dict]:
+        """
+        Find the transcripts of one session whose text contains a keyword
+        
+        Args:
+            session_id: Session identifier
+            contains_keyword: Case-insensitive test on transcript text
+            line_filter: Optional prefilter on raw JSONL lines
+            file_pattern: Optional pattern locating keywords in the raw session file
+        
+        Returns:
+            List of matching transcript entries with session info
+        """
+        matching_entries = []
+        
+        # A cached session is scanned through its text column alone
+        columns = self._cached_columns(session_id)[0]
+        if columns is not None:
+            matches = (columns.row(index) for index, text in enumerate(columns.texts)
+                       if contains_keyword(text))
+        else:
+            # Otherwise stream it without keeping every entry
+            transcripts = None
+            if file_pattern is not None:
+                transcripts = self._mapped_candidates(session_id, file_pattern)
+            if transcripts is None:
+                transcripts = self._iter_transcripts(session_id, line_filter)
+            matches = (transcript for transcript in transcripts
+                       if contains_keyword(transcript.get("text", "")))
+        
+        for result in matches:
+            # Add session info to result
+            result["session_id"] = session_id
+            matching_entries.append(result)
         
-        logger.info(f"Found {len(matching_entries)} transcripts matching keywords: {keywords_list}")
         return matching_entries
     
     def export_to_txt(self, session_id: str, output_file: str):
@@ -195,6 +933,7 @@ class TranscriptManager:
             session_id: Session identifier
             output_file: Path to output text file
         """
+        self._flush_session(session_id)
         session_data = self._load_session(session_id)
         transcripts = session_data.get("transcripts", [])
         
@@ -202,18 +941,23 @@ class TranscriptManager:
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
         try:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(f"Session: {session_id}\n")
-                f.write(f"Created: {session_data.get('created_at', 'Unknown')}\n")
-                f.write(f"Total Transcripts: {len(transcripts)}\n")
-                f.write("=" * 80 + "\n\n")
-                
-                for idx, transcript in enumerate(transcripts, 1):
-                    f.write(f"--- Transcript #{idx} ---\n")
-                    f.write(f"Timestamp: {transcript.get('timestamp', 'N/A')}\n")
-                    f.write(f"Audio File: {transcript.get('audio_file', 'N/A')}\n")
-                    f.write(f"Text: {transcript.get('text', '')}\n")
-                    f.write("\n")
+            header = (
+                f"Session: {session_id}\n"
+                f"Created: {session_data.get('created_at', 'Unknown')}\n"
+                f"Total Transcripts: {len(transcripts)}\n"
+                + "=" * 80 + "\n\n"
+            )
+            
+            # One string per transcript, all handed to a single buffered writelines
+            with open(output_path, 'w', encoding='utf-8', buffering=IO_BUFFER_SIZE) as f:
+                f.write(header)
+                f.writelines(
+                    f"--- Transcript #{idx} ---\n"
+                    f"Timestamp: {transcript.get('timestamp', 'N/A')}\n"
+                    f"Audio File: {transcript.get('audio_file', 'N/A')}\n"
+                    f"Text: {transcript.get('text', '')}\n\n"
+                    for idx, transcript in enumerate(transcripts, 1)
+                )
             
             logger.info(f"Exported {len(transcripts)} transcripts to: {output_path}")
         
@@ -221,22 +965,78 @@ class TranscriptManager:
             logger.error(f"Error exporting to TXT: {e}")
             raise
     
-    def export_to_json(self, session_id: str, output_file: str):
+    def _verified_jsonl_lines(self, session_id: str) -> Optional[List[bytes]]:
+        """
+        Read a session's raw JSONL lines if every one of them is known to parse
+        
+        The statistics sidecar counts the entries that parsed when the file
+        had its current size, so a matching line count rules out torn lines.
+        
+        Args:
+            session_id: Session identifier
+        
+        Returns:
+            Raw entry lines without newlines, or None if they cannot be vouched for
+        """
+        try:
+            with open(self._session_jsonl_path(session_id), 'rb', buffering=IO_BUFFER_SIZE) as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+        
+        stats = _read_json_file(self._session_stats_path(session_id))
+        if stats is None or stats.get("jsonl_size") != len(data):
+            return None
+        
+        lines = [line for line in data.split(b"\n") if line.strip()]
+        if stats.get("total_transcripts") != len(lines):
+            return None
+        return lines
+    
+    def export_to_json(self, session_id: str, output_file: str,
+                       transform: Optional[Callable[[Dict], Dict]] = None):
         """
         Export session transcripts to JSON file
         
+        Without a transform the stored bytes are reused: a legacy session file
+        is copied as is, and JSONL entries are spliced into the document
+        without being parsed or encoded again.
+        
         Args:
             session_id: Session identifier
             output_file: Path to output JSON file
+            transform: Optional function applied to the session dictionary
+                before it is written (indented) to the file
         """
-        session_data = self._load_session(session_id)
+        self._flush_session(session_id)
         
         output_path = Path(output_file)
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
         try:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(session_data, f, indent=2, ensure_ascii=False)
+            lines = None
+            if transform is None:
+                if self._session_source(session_id) == self._get_session_file(session_id):
+                    shutil.copyfile(self._get_session_file(session_id), output_path)
+                    logger.info(f"Exported session to: {output_path}")
+                    return
+                lines = self._verified_jsonl_lines(session_id)
+            
+            if lines is not None:
+                # Open the header object and append the entries as the transcripts array
+                header = _dumps(self._load_meta(session_id))[:-1] + b',"transcripts":['
+                with open(output_path, 'wb', buffering=IO_BUFFER_SIZE) as f:
+                    f.write(header)
+                    f.write(b",".join(lines))
+                    f.write(b"]}")
+            elif transform is None:
+                # Same compact document, rebuilt from the parsed entries
+                with open(output_path, 'wb', buffering=IO_BUFFER_SIZE) as f:
+                    f.write(_dumps(self._load_session(session_id)))
+            else:
+                session_data = transform(self._load_session(session_id))
+                with open(output_path, 'w', encoding='utf-8') as f:
+                    json.dump(session_data, f, indent=2, ensure_ascii=False)
             
             logger.info(f"Exported session to: {output_path}")
         
@@ -251,8 +1051,20 @@ class TranscriptManager:
         Returns:
             List of session ID strings
         """
-        session_files = list(self.base_dir.glob("session_*.json"))
-        session_ids = [f.stem.replace("session_", "") for f in session_files]
+        self.flush_all()
+        
+        # scandir entries carry their name and type, so no Path objects or extra stats
+        session_ids = set()
+        with os.scandir(self.base_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if not name.startswith("session_") or not entry.is_file(follow_symlinks=False):
+                    continue
+                if name.endswith(".jsonl"):
+                    session_ids.add(name[len("session_"):-len(".jsonl")])
+                elif name.endswith(".json") and "." not in name[:-len(".json")]:
+                    # Legacy session; skips the .meta.json sidecars
+                    session_ids.add(name[len("session_"):-len(".json")])
         return sorted(session_ids)
     
     def get_session_stats(self, session_id: str) -> Dict:
@@ -265,19 +1077,38 @@ class TranscriptManager:
         Returns:
             Dictionary with session statistics
         """
-        session_data = self._load_session(session_id)
-        transcripts = session_data.get("transcripts", [])
+        self._flush_session(session_id)
+        jsonl_file = self._session_jsonl_path(session_id)
+        
+        # Use the running totals while they still describe the JSONL file
+        try:
+            jsonl_size = jsonl_file.stat().st_size
+        except FileNotFoundError:
+            jsonl_size = None
+        
+        stats = None
+        if jsonl_size is not None:
+            stats = _read_json_file(self._session_stats_path(session_id))
+            if stats is not None and stats.get("jsonl_size") != jsonl_size:
+                stats = None
+        
+        if stats is None:
+            # Recount from the text column and keep the totals for next time
+            stats = _text_totals(self._read_columns(session_id).texts)
+            if jsonl_size is not None:
+                self._write_stats(session_id, {"jsonl_size": jsonl_size, **stats})
         
-        total_chars = sum(len(t.get("text", "")) for t in transcripts)
-        total_words = sum(len(t.get("text", "").split()) for t in transcripts)
+        created_at = self._load_meta(session_id).get("created_at", "Unknown")
+        total_transcripts = stats.get("total_transcripts", 0)
+        total_words = stats.get("total_words", 0)
         
         return {
             "session_id": session_id,
-            "created_at": session_data.get("created_at", "Unknown"),
-            "total_transcripts": len(transcripts),
-            "total_characters": total_chars,
+            "created_at": created_at,
+            "total_transcripts": total_transcripts,
+            "total_characters": stats.get("total_characters", 0),
             "total_words": total_words,
-            "average_words_per_transcript": total_words // len(transcripts) if transcripts else 0
+            "average_words_per_transcript": total_words // total_transcripts if total_transcripts else 0
         }
 
 
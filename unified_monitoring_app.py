@@ -1,18 +1,76 @@
 import tkinter as tk
 from tkinter import scrolledtext, messagebox, ttk
+from tkinter import font as tkfont
 from audio_logger import AudioToTextLogger
 from camera_classifier import CameraClassifier
-import threading
+from collections import deque
+from heapq import nlargest
+from operator import itemgetter
 import cv2
 from PIL import Image, ImageTk
 import numpy as np
+import logging
+import os
+import time
+
+logger = logging.getLogger(__name__)
+
+# Size (width, height) of the camera preview
+PREVIEW_SIZE = (480, 360)
+# Milliseconds between camera preview repaints
+PREVIEW_INTERVAL_MS = 100
+# Seconds between repeated camera preview error logs
+PREVIEW_ERROR_LOG_INTERVAL = 5.0
+# Title of the OpenCV window used when the preview is shown outside Tk
+EXTERNAL_PREVIEW_WINDOW = "SiteLenz Camera"
+# Milliseconds each notification stays on screen
+TOAST_DURATION_MS = 3000
+# Milliseconds between status and log view refreshes
+UI_TICK_MS = 1000
+# Most entries rendered from a single update, and most lines kept in a log view
+MAX_LOG_ENTRIES = 500
+MAX_LOG_LINES = 3000
+# Label color for each classification
+_CLASS_COLORS = {
+    'Plain (Normal)': '#4CAF50',  # Green
+    'Minor Crack': '#FF9800',     # Orange
+    'Major Crack': '#f44336',     # Red
+    'Algae': '#00BCD4',           # Cyan
+    'Stain': '#9C27B0',           # Purple
+    'Peeling': '#FF5722',         # Deep Orange
+    'Spalling': '#E91E63'         # Pink
+}
 
 class UnifiedMonitoringApp:
-    def __init__(self, root):
+    # Fonts
+    _FONT_TITLE = ("Arial", 28, "bold")
+    _FONT_SECTION = ("Arial", 12, "bold")
+    _FONT_HEADING = ("Arial", 11, "bold")
+    _FONT_BUTTON = ("Arial", 10, "bold")
+    _FONT_STATUS = ("Arial", 9)
+    _FONT_LOG = ("Consolas", 9)
+    
+    # Colors
+    _BG = "#f0f0f0"
+    _BG_PANEL = "white"
+    _BG_HEADER = "#667eea"
+    _FG_TEXT = "#333"
+    _FG_MUTED = "#666"
+    
+    def __init__(self, root, external_preview=False):
+        """
+        Build the monitoring window.
+        
+        Args:
+            root: Tk root window
+            external_preview: Show the camera feed in a separate OpenCV window
+                instead of the Tk panel
+        """
         self.root = root
+        self.external_preview = external_preview
         self.root.title("SiteLenz - Audio & Visual Monitoring System")
         self.root.geometry("1400x900")
-        self.root.configure(bg="#f0f0f0")
+        self.root.configure(bg=self._BG)
         
         # Initialize loggers
         self.audio_logger = AudioToTextLogger(engine="google")
@@ -25,6 +83,18 @@ class UnifiedMonitoringApp:
         self.is_audio_recording = False
         self.is_camera_recording = False
         self.camera_preview_running = False
+        self._external_window_open = False
+        
+        # Number of entries already rendered in each log view
+        self._n_trans_rendered = 0
+        self._n_class_rendered = 0
+        
+        # Producer versions the log views were last refreshed at
+        self._last_trans_version = None
+        self._last_class_version = None
+        
+        # (text, fg) last applied to each label, keyed by id(label)
+        self._label_cache = {}
         
         # UI Elements
         self.create_widgets()
@@ -32,98 +102,118 @@ class UnifiedMonitoringApp:
         # Start camera preview
         self.start_camera_preview()
         
-        # Update loops
-        self.update_status()
-        self.update_transcripts()
-        self.update_classifications()
+        # Update loop
+        self._ui_tick()
     
     def create_widgets(self):
         # ==================== HEADER ====================
-        header_frame = tk.Frame(self.root, bg="#667eea", height=100)
+        header_frame = tk.Frame(self.root, bg=self._BG_HEADER, height=100)
         header_frame.pack(fill=tk.X)
         header_frame.pack_propagate(False)
         
         title = tk.Label(header_frame, text="🏗️ SiteLenz Monitoring System", 
-                        font=("Arial", 28, "bold"),
-                        bg="#667eea", fg="white")
+                        font=self._FONT_TITLE,
+                        bg=self._BG_HEADER, fg="white")
         title.pack(pady=25)
         
         # ==================== MAIN CONTAINER ====================
-        main_frame = tk.Frame(self.root, bg="#f0f0f0")
+        main_frame = tk.Frame(self.root, bg=self._BG)
         main_frame.pack(fill=tk.BOTH, expand=True, padx=15, pady=15)
         
         # ==================== TOP SECTION: CAMERA & AUDIO CONTROLS ====================
-        top_frame = tk.Frame(main_frame, bg="#f0f0f0")
+        top_frame = tk.Frame(main_frame, bg=self._BG)
         top_frame.pack(fill=tk.X, pady=(0, 10))
         
         # Camera Preview (Left)
         camera_frame = tk.LabelFrame(top_frame, text="📹 Camera Feed", 
-                                     font=("Arial", 12, "bold"),
-                                     bg="white", relief=tk.RIDGE, bd=2)
+                                     font=self._FONT_SECTION,
+                                     bg=self._BG_PANEL, relief=tk.RIDGE, bd=2)
         camera_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 5))
         
-        self.camera_label = tk.Label(camera_frame, bg="black")
+        # One persistent preview image, updated in place every frame. The
+        # image is a zero-copy view of _rgba_buf (Pillow only maps 4-byte
+        # modes without copying), so converting a frame into the buffer
+        # updates it directly
+        width, height = PREVIEW_SIZE
+        self._resize_buf = np.empty((height, width, 3), dtype=np.uint8)
+        self._rgba_buf = np.empty((height, width, 4), dtype=np.uint8)
+        self._preview_img = Image.frombuffer("RGBA", PREVIEW_SIZE, self._rgba_buf,
+                                             "raw", "RGBA", 0, 1)
+        self._preview_photo = ImageTk.PhotoImage(self._preview_img)
+        
+        # Render the "Camera Off" placeholder once and start out showing it
+        placeholder = np.zeros_like(self._resize_buf)
+        cv2.putText(placeholder, "Camera Off", (150, 180),
+                  cv2.FONT_HERSHEY_SIMPLEX, 1.5, (100, 100, 100), 2)
+        self._off_photo = ImageTk.PhotoImage(Image.fromarray(placeholder))
+        self._showing_frames = False
+        self._last_preview_error = float('-inf')
+        
+        self.camera_label = tk.Label(camera_frame, bg="black", image=self._off_photo)
         self.camera_label.pack(padx=10, pady=10)
+        if self.external_preview:
+            self.camera_label.configure(text="Camera feed opens in a separate window",
+                                        image="", fg="white", width=60, height=20)
         
         # Latest Classification
         self.latest_class_label = tk.Label(camera_frame, 
                                           text="Classification: Waiting...",
-                                          font=("Arial", 11, "bold"),
-                                          bg="white", fg="#333")
+                                          font=self._FONT_HEADING,
+                                          bg=self._BG_PANEL, fg=self._FG_TEXT)
         self.latest_class_label.pack(pady=5)
         
         # Controls (Right)
         control_frame = tk.LabelFrame(top_frame, text="🎛️ Control Panel", 
-                                      font=("Arial", 12, "bold"),
-                                      bg="white", relief=tk.RIDGE, bd=2)
+                                      font=self._FONT_SECTION,
+                                      bg=self._BG_PANEL, relief=tk.RIDGE, bd=2)
         control_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(5, 0))
         
         # Audio Controls
-        audio_section = tk.Frame(control_frame, bg="white")
+        audio_section = tk.Frame(control_frame, bg=self._BG_PANEL)
         audio_section.pack(pady=10, padx=10, fill=tk.X)
         
         tk.Label(audio_section, text="🎤 Audio Recording", 
-                font=("Arial", 11, "bold"), bg="white").pack(anchor=tk.W, pady=5)
+                font=self._FONT_HEADING, bg=self._BG_PANEL).pack(anchor=tk.W, pady=5)
         
-        audio_btn_frame = tk.Frame(audio_section, bg="white")
+        audio_btn_frame = tk.Frame(audio_section, bg=self._BG_PANEL)
         audio_btn_frame.pack(pady=5)
         
         self.audio_start_btn = tk.Button(audio_btn_frame, text="▶ Start Audio",
                                          command=self.start_audio_recording,
                                          bg="#4CAF50", fg="white",
-                                         font=("Arial", 10, "bold"),
+                                         font=self._FONT_BUTTON,
                                          padx=20, pady=8, cursor="hand2")
         self.audio_start_btn.grid(row=0, column=0, padx=5)
         
         self.audio_stop_btn = tk.Button(audio_btn_frame, text="⏹ Stop Audio",
                                         command=self.stop_audio_recording,
                                         bg="#f44336", fg="white",
-                                        font=("Arial", 10, "bold"),
+                                        font=self._FONT_BUTTON,
                                         padx=20, pady=8,
                                         state=tk.DISABLED, cursor="hand2")
         self.audio_stop_btn.grid(row=0, column=1, padx=5)
         
         # Camera Controls
-        camera_section = tk.Frame(control_frame, bg="white")
+        camera_section = tk.Frame(control_frame, bg=self._BG_PANEL)
         camera_section.pack(pady=10, padx=10, fill=tk.X)
         
         tk.Label(camera_section, text="📸 Visual Monitoring", 
-                font=("Arial", 11, "bold"), bg="white").pack(anchor=tk.W, pady=5)
+                font=self._FONT_HEADING, bg=self._BG_PANEL).pack(anchor=tk.W, pady=5)
         
-        camera_btn_frame = tk.Frame(camera_section, bg="white")
+        camera_btn_frame = tk.Frame(camera_section, bg=self._BG_PANEL)
         camera_btn_frame.pack(pady=5)
         
         self.camera_start_btn = tk.Button(camera_btn_frame, text="▶ Start Camera",
                                           command=self.start_camera_recording,
                                           bg="#2196F3", fg="white",
-                                          font=("Arial", 10, "bold"),
+                                          font=self._FONT_BUTTON,
                                           padx=20, pady=8, cursor="hand2")
         self.camera_start_btn.grid(row=0, column=0, padx=5)
         
         self.camera_stop_btn = tk.Button(camera_btn_frame, text="⏹ Stop Camera",
                                          command=self.stop_camera_recording,
                                          bg="#FF9800", fg="white",
-                                         font=("Arial", 10, "bold"),
+                                         font=self._FONT_BUTTON,
                                          padx=20, pady=8,
                                          state=tk.DISABLED, cursor="hand2")
         self.camera_stop_btn.grid(row=0, column=1, padx=5)
@@ -133,75 +223,92 @@ class UnifiedMonitoringApp:
         unified_section.pack(pady=10, padx=10, fill=tk.X)
         
         tk.Label(unified_section, text="⚡ Quick Actions", 
-                font=("Arial", 11, "bold"), bg="#e8f5e9").pack(pady=5)
+                font=self._FONT_HEADING, bg="#e8f5e9").pack(pady=5)
         
         self.start_all_btn = tk.Button(unified_section, text="🚀 Start Both",
                                        command=self.start_all,
                                        bg="#9C27B0", fg="white",
-                                       font=("Arial", 11, "bold"),
+                                       font=self._FONT_HEADING,
                                        padx=30, pady=10, cursor="hand2")
         self.start_all_btn.pack(pady=5)
         
         self.stop_all_btn = tk.Button(unified_section, text="⏹ Stop Both",
                                       command=self.stop_all,
                                       bg="#795548", fg="white",
-                                      font=("Arial", 11, "bold"),
+                                      font=self._FONT_HEADING,
                                       padx=30, pady=10,
                                       state=tk.DISABLED, cursor="hand2")
         self.stop_all_btn.pack(pady=5)
         
         # Status Display
-        status_frame = tk.Frame(control_frame, bg="white")
+        status_frame = tk.Frame(control_frame, bg=self._BG_PANEL)
         status_frame.pack(pady=10, padx=10, fill=tk.X)
         
         self.audio_status = tk.Label(status_frame, text="🎤 Audio: Idle",
-                                     font=("Arial", 9), bg="white", fg="#666",
+                                     font=self._FONT_STATUS, bg=self._BG_PANEL, fg=self._FG_MUTED,
                                      anchor=tk.W)
         self.audio_status.pack(fill=tk.X, pady=2)
         
         self.camera_status = tk.Label(status_frame, text="📸 Camera: Idle",
-                                      font=("Arial", 9), bg="white", fg="#666",
+                                      font=self._FONT_STATUS, bg=self._BG_PANEL, fg=self._FG_MUTED,
                                       anchor=tk.W)
         self.camera_status.pack(fill=tk.X, pady=2)
         
         self.audio_count_label = tk.Label(status_frame, text="Transcripts: 0",
-                                          font=("Arial", 9), bg="white", fg="#666",
+                                          font=self._FONT_STATUS, bg=self._BG_PANEL, fg=self._FG_MUTED,
                                           anchor=tk.W)
         self.audio_count_label.pack(fill=tk.X, pady=2)
         
         self.camera_count_label = tk.Label(status_frame, text="Classifications: 0",
-                                           font=("Arial", 9), bg="white", fg="#666",
+                                           font=self._FONT_STATUS, bg=self._BG_PANEL, fg=self._FG_MUTED,
                                            anchor=tk.W)
         self.camera_count_label.pack(fill=tk.X, pady=2)
         
         # ==================== BOTTOM SECTION: LOGS ====================
-        bottom_frame = tk.Frame(main_frame, bg="#f0f0f0")
+        bottom_frame = tk.Frame(main_frame, bg=self._BG)
         bottom_frame.pack(fill=tk.BOTH, expand=True)
         
         # Transcripts (Left)
         transcript_frame = tk.LabelFrame(bottom_frame, text="📝 Audio Transcripts", 
-                                        font=("Arial", 11, "bold"),
-                                        bg="white", relief=tk.RIDGE, bd=2)
+                                        font=self._FONT_HEADING,
+                                        bg=self._BG_PANEL, relief=tk.RIDGE, bd=2)
         transcript_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 5))
         
         self.transcript_text = scrolledtext.ScrolledText(
             transcript_frame, width=45, height=20, 
-            font=("Consolas", 9),
-            bg="white", fg="#333", relief=tk.FLAT)
+            font=self._FONT_LOG,
+            bg=self._BG_PANEL, fg=self._FG_TEXT, relief=tk.FLAT)
         self.transcript_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
         # Classifications (Right)
         classification_frame = tk.LabelFrame(bottom_frame, text="🔍 Visual Classifications", 
-                                            font=("Arial", 11, "bold"),
-                                            bg="white", relief=tk.RIDGE, bd=2)
+                                            font=self._FONT_HEADING,
+                                            bg=self._BG_PANEL, relief=tk.RIDGE, bd=2)
         classification_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(5, 0))
         
         self.classification_text = scrolledtext.ScrolledText(
             classification_frame, width=45, height=20, 
-            font=("Consolas", 9),
-            bg="white", fg="#333", relief=tk.FLAT)
+            font=self._FONT_LOG,
+            bg=self._BG_PANEL, fg=self._FG_TEXT, relief=tk.FLAT)
         self.classification_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
+        # Text tags, configured once with shared fonts
+        self._ts_font = tkfont.Font(family="Arial", size=9, weight="bold")
+        self._pred_font = tkfont.Font(family="Arial", size=10, weight="bold")
+        self._prob_font = tkfont.Font(family="Arial", size=8)
+        
+        self.transcript_text.tag_config("timestamp", foreground="#667eea", font=self._ts_font)
+        self.transcript_text.tag_config("text", foreground=self._FG_TEXT)
+        self.classification_text.tag_config("timestamp", foreground="#2196F3", font=self._ts_font)
+        self.classification_text.tag_config("prediction", foreground=self._FG_TEXT, font=self._pred_font)
+        self.classification_text.tag_config("prob", foreground=self._FG_MUTED, font=self._prob_font)
+        
+        # Non-modal notifications, shown one at a time
+        self._toast = tk.Label(self.root, bg="#323232", fg="white",
+                               font=self._FONT_STATUS, padx=16, pady=8)
+        self._toast_queue = deque()
+        self._toast_after_id = None
+        
         # Initial messages
         self.transcript_text.insert(tk.END, 
             "No audio transcripts yet.\n"
@@ -212,42 +319,86 @@ class UnifiedMonitoringApp:
             "Click 'Start Camera' to begin monitoring.\n\n")
     
     def start_camera_preview(self):
-        """Start camera preview in background."""
+        """Start the camera preview on the Tk event loop."""
         self.camera_preview_running = True
-        threading.Thread(target=self._update_camera_preview, daemon=True).start()
+        self._tick_preview()
     
-    def _update_camera_preview(self):
-        """Update camera preview continuously."""
-        while self.camera_preview_running:
-            try:
-                frame = self.camera_classifier.get_latest_frame()
-                if frame is not None:
-                    # Resize for display
-                    frame = cv2.resize(frame, (480, 360))
-                    # Convert BGR to RGB
-                    rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                    # Convert to PIL Image
-                    img = Image.fromarray(rgb_frame)
-                    # Convert to PhotoImage
-                    photo = ImageTk.PhotoImage(img)
-                    # Update label
-                    self.camera_label.configure(image=photo)
-                    self.camera_label.image = photo
+    def _tick_preview(self):
+        """Paint the latest camera frame and schedule the next tick."""
+        if not self.camera_preview_running:
+            return
+        
+        if not self.camera_classifier.is_recording:
+            # Show placeholder when camera is off
+            if self._external_window_open:
+                self._close_external_preview()
+            elif self._showing_frames:
+                self._show_preview_image(self._off_photo)
+                self._showing_frames = False
+        else:
+            # None means no frame arrived since the last tick
+            frame = self.camera_classifier.get_latest_frame()
+            if frame is not None:
+                if self.external_preview:
+                    self._show_external_frame(frame)
                 else:
-                    # Show placeholder when camera is off
-                    placeholder = np.zeros((360, 480, 3), dtype=np.uint8)
-                    cv2.putText(placeholder, "Camera Off", (150, 180),
-                              cv2.FONT_HERSHEY_SIMPLEX, 1.5, (100, 100, 100), 2)
-                    img = Image.fromarray(placeholder)
-                    photo = ImageTk.PhotoImage(img)
-                    self.camera_label.configure(image=photo)
-                    self.camera_label.image = photo
-                
-                self.root.after(100)  # Update every 100ms
-            except Exception as e:
-                pass
-            
-            threading.Event().wait(0.1)
+                    self._paint_frame(frame)
+        
+        self.root.after(PREVIEW_INTERVAL_MS, self._tick_preview)
+    
+    def _show_external_frame(self, frame):
+        """Show a BGR camera frame as-is in the external OpenCV window."""
+        try:
+            cv2.imshow(EXTERNAL_PREVIEW_WINDOW, frame)
+            # Let HighGUI process its window events
+            cv2.waitKey(1)
+            self._external_window_open = True
+        except cv2.error as e:
+            self._log_preview_error(f"Could not update external preview: {e}")
+    
+    def _close_external_preview(self):
+        """Close the external OpenCV preview window."""
+        try:
+            cv2.destroyWindow(EXTERNAL_PREVIEW_WINDOW)
+        except cv2.error as e:
+            self._log_preview_error(f"Could not close external preview: {e}")
+        self._external_window_open = False
+    
+    def _paint_frame(self, frame):
+        """Copy a BGR camera frame into the persistent preview image."""
+        try:
+            # Resize and convert BGR to RGBA into the preallocated buffers
+            cv2.resize(frame, PREVIEW_SIZE, dst=self._resize_buf,
+                       interpolation=cv2.INTER_AREA)
+            cv2.cvtColor(self._resize_buf, cv2.COLOR_BGR2RGBA, dst=self._rgba_buf)
+        except cv2.error as e:
+            self._log_preview_error(f"Could not convert camera frame: {e}")
+            return
+        
+        try:
+            # Update the persistent image instead of building a new PhotoImage
+            self._preview_photo.paste(self._preview_img)
+        except (tk.TclError, ValueError) as e:
+            self._log_preview_error(f"Could not update camera preview: {e}")
+            return
+        
+        if not self._showing_frames:
+            self._show_preview_image(self._preview_photo)
+            self._showing_frames = True
+    
+    def _show_preview_image(self, photo):
+        """Point the camera label at another PhotoImage."""
+        try:
+            self.camera_label.configure(image=photo)
+        except tk.TclError as e:
+            self._log_preview_error(f"Could not update camera preview: {e}")
+    
+    def _log_preview_error(self, message):
+        """Log a preview error, at most once per PREVIEW_ERROR_LOG_INTERVAL."""
+        now = time.monotonic()
+        if now - self._last_preview_error >= PREVIEW_ERROR_LOG_INTERVAL:
+            self._last_preview_error = now
+            logger.warning(message)
     
     def start_audio_recording(self):
         """Start audio recording."""
@@ -260,10 +411,10 @@ class UnifiedMonitoringApp:
             self.update_control_buttons()
             
             self.transcript_text.delete(1.0, tk.END)
+            self._n_trans_rendered = 0
             self.transcript_text.insert(tk.END, f"🎤 Recording started - Session: {session_id}\n\n")
             
-            messagebox.showinfo("Audio Started", 
-                              f"Audio recording started!\nSession: {session_id}\n\nSpeak into your microphone.")
+            self._notify(f"Audio recording started - Session: {session_id}. Speak into your microphone.")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to start audio:\n{e}")
     
@@ -277,9 +428,7 @@ class UnifiedMonitoringApp:
             self.audio_stop_btn.config(state=tk.DISABLED)
             self.update_control_buttons()
             
-            messagebox.showinfo("Audio Stopped", 
-                              f"Audio recording stopped!\n\n"
-                              f"Transcripts: {summary['transcript_count']}")
+            self._notify(f"Audio recording stopped - Transcripts: {summary['transcript_count']}")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to stop audio:\n{e}")
     
@@ -294,12 +443,12 @@ class UnifiedMonitoringApp:
             self.update_control_buttons()
             
             self.classification_text.delete(1.0, tk.END)
+            self._n_class_rendered = 0
             self.classification_text.insert(tk.END, 
                 f"📸 Camera recording started - Session: {session_id}\n\n")
             
-            messagebox.showinfo("Camera Started", 
-                              f"Camera monitoring started!\nSession: {session_id}\n\n"
-                              f"Capturing frames every 5 seconds.")
+            self._notify(f"Camera monitoring started - Session: {session_id}. "
+                         f"Capturing frames every 5 seconds.")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to start camera:\n{e}")
     
@@ -313,12 +462,33 @@ class UnifiedMonitoringApp:
             self.camera_stop_btn.config(state=tk.DISABLED)
             self.update_control_buttons()
             
-            messagebox.showinfo("Camera Stopped", 
-                              f"Camera monitoring stopped!\n\n"
-                              f"Classifications: {summary['classification_count']}")
+            self._notify(f"Camera monitoring stopped - Classifications: {summary['classification_count']}")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to stop camera:\n{e}")
     
+    def _notify(self, message):
+        """
+        Queue a non-modal notification at the bottom of the window.
+        
+        Args:
+            message: Text to show
+        """
+        self._toast_queue.append(message)
+        if self._toast_after_id is None:
+            self._show_next_toast()
+    
+    def _show_next_toast(self):
+        """Show the next queued notification, or hide the toast when done."""
+        if not self._toast_queue:
+            self._toast.place_forget()
+            self._toast_after_id = None
+            return
+        
+        self._toast.config(text=self._toast_queue.popleft())
+        self._toast.place(relx=0.5, rely=0.97, anchor='s')
+        self._toast.lift()
+        self._toast_after_id = self.root.after(TOAST_DURATION_MS, self._show_next_toast)
+    
     def start_all(self):
         """Start both audio and camera."""
         self.start_audio_recording()
@@ -340,102 +510,112 @@ class UnifiedMonitoringApp:
             self.start_all_btn.config(state=tk.NORMAL)
             self.stop_all_btn.config(state=tk.DISABLED)
     
-    def update_status(self):
-        """Update status labels."""
+    def _set(self, label, text, fg=None):
+        """Configure a label only if its text or color would change."""
+        value = (text, fg)
+        key = id(label)
+        if self._label_cache.get(key) == value:
+            return
+        self._label_cache[key] = value
+        if fg is None:
+            label.config(text=text)
+        else:
+            label.config(text=text, fg=fg)
+    
+    def _ui_tick(self):
+        """Refresh status labels and log views from one read of producer state."""
         # Audio status
         if self.is_audio_recording:
-            self.audio_status.config(text="🎤 Audio: 🔴 Recording...", fg="red")
+            self._set(self.audio_status, "🎤 Audio: 🔴 Recording...", "red")
         else:
-            self.audio_status.config(text="🎤 Audio: Idle", fg="#666")
+            self._set(self.audio_status, "🎤 Audio: Idle", self._FG_MUTED)
         
         # Camera status
         if self.is_camera_recording:
-            self.camera_status.config(text="📸 Camera: 🔴 Recording...", fg="red")
+            self._set(self.camera_status, "📸 Camera: 🔴 Recording...", "red")
         else:
-            self.camera_status.config(text="📸 Camera: Idle", fg="#666")
+            self._set(self.camera_status, "📸 Camera: Idle", self._FG_MUTED)
         
-        # Counts
-        audio_info = self.audio_logger.get_session_info()
-        camera_info = self.camera_classifier.get_session_info()
+        # Log views and counts, only when the producers report a change
+        trans_version = self.audio_logger.get_version()
+        if trans_version != self._last_trans_version:
+            self._last_trans_version = trans_version
+            self.update_transcripts()
+            self._set(self.audio_count_label, f"Transcripts: {self._n_trans_rendered}")
         
-        self.audio_count_label.config(text=f"Transcripts: {audio_info['transcript_count']}")
-        self.camera_count_label.config(text=f"Classifications: {camera_info['classification_count']}")
+        class_version = self.camera_classifier.get_version()
+        if class_version != self._last_class_version:
+            self._last_class_version = class_version
+            self.update_classifications()
+            self._set(self.camera_count_label, f"Classifications: {self._n_class_rendered}")
         
         # Schedule next update
-        self.root.after(2000, self.update_status)
+        self.root.after(UI_TICK_MS, self._ui_tick)
     
     def update_transcripts(self):
-        """Update transcript display."""
-        if self.is_audio_recording or self.audio_logger.get_transcripts():
-            transcripts = self.audio_logger.get_transcripts()
+        """Append transcripts that arrived since the last update."""
+        new_transcripts = self.audio_logger.get_transcripts(start=self._n_trans_rendered)
+        
+        if new_transcripts:
+            # Entries beyond the view's capacity would be trimmed right away
+            first = self._n_trans_rendered + 1
+            skipped = max(0, len(new_transcripts) - MAX_LOG_ENTRIES)
+            # Alternating (text, tag) pairs, inserted in a single call
+            chunks = []
+            for i, t in enumerate(new_transcripts[skipped:], first + skipped):
+                timestamp = t['timestamp'][11:19]
+                chunks += (f"[{i}] {timestamp}\n", "timestamp",
+                           f"{t['text']}\n\n", "text")
+            self.transcript_text.insert(tk.END, *chunks)
             
-            if transcripts:
-                self.transcript_text.delete(1.0, tk.END)
-                for i, t in enumerate(transcripts, 1):
-                    timestamp = t['timestamp'].split('T')[1].split('.')[0]
-                    self.transcript_text.insert(tk.END, f"[{i}] {timestamp}\n", "timestamp")
-                    self.transcript_text.insert(tk.END, f"{t['text']}\n\n", "text")
-                
-                self.transcript_text.tag_config("timestamp", foreground="#667eea", font=("Arial", 9, "bold"))
-                self.transcript_text.tag_config("text", foreground="#333")
-                self.transcript_text.see(tk.END)
-        
-        if self.is_audio_recording:
-            self.root.after(3000, self.update_transcripts)
-        else:
-            self.root.after(5000, self.update_transcripts)
+            self._n_trans_rendered += len(new_transcripts)
+            self._trim_log(self.transcript_text)
+            self.transcript_text.see(tk.END)
     
     def update_classifications(self):
-        """Update classification display."""
-        if self.is_camera_recording or self.camera_classifier.get_classifications():
-            classifications = self.camera_classifier.get_classifications()
-            
-            if classifications:
-                self.classification_text.delete(1.0, tk.END)
-                for i, c in enumerate(classifications, 1):
-                    timestamp = c['timestamp'].split('T')[1].split('.')[0]
-                    self.classification_text.insert(tk.END, f"[{i}] {timestamp}\n", "timestamp")
-                    self.classification_text.insert(tk.END, 
-                        f"🏗️ {c['prediction']} ({c['confidence']:.1f}%)\n", "prediction")
-                    
-                    # Show top 3 probabilities
-                    sorted_probs = sorted(c['probabilities'].items(), 
-                                         key=lambda x: x[1], reverse=True)[:3]
-                    for cls, prob in sorted_probs:
-                        self.classification_text.insert(tk.END, 
-                            f"   • {cls}: {prob:.1f}%\n", "prob")
-                    self.classification_text.insert(tk.END, "\n")
+        """Append classifications that arrived since the last update."""
+        new_classifications = self.camera_classifier.get_classifications(start=self._n_class_rendered)
+        
+        if new_classifications:
+            # Entries beyond the view's capacity would be trimmed right away
+            first = self._n_class_rendered + 1
+            skipped = max(0, len(new_classifications) - MAX_LOG_ENTRIES)
+            # Alternating (text, tag) pairs, inserted in a single call
+            chunks = []
+            for i, c in enumerate(new_classifications[skipped:], first + skipped):
+                timestamp = c['timestamp'][11:19]
                 
-                # Update latest classification label
-                if classifications:
-                    latest = classifications[-1]
-                    self.latest_class_label.config(
-                        text=f"Latest: {latest['prediction']} ({latest['confidence']:.1f}%)",
-                        fg=self._get_color_for_class(latest['prediction'])
-                    )
+                # Show top 3 probabilities
+                top_probs = nlargest(3, c['probabilities'].items(), key=itemgetter(1))
+                probs_text = "".join(f"   • {cls}: {prob:.1f}%\n" for cls, prob in top_probs)
                 
-                self.classification_text.tag_config("timestamp", foreground="#2196F3", font=("Arial", 9, "bold"))
-                self.classification_text.tag_config("prediction", foreground="#333", font=("Arial", 10, "bold"))
-                self.classification_text.tag_config("prob", foreground="#666", font=("Arial", 8))
-                self.classification_text.see(tk.END)
-        
-        if self.is_camera_recording:
-            self.root.after(3000, self.update_classifications)
-        else:
-            self.root.after(5000, self.update_classifications)
+                chunks += (f"[{i}] {timestamp}\n", "timestamp",
+                           f"🏗️ {c['prediction']} ({c['confidence']:.1f}%)\n", "prediction",
+                           probs_text, "prob",
+                           "\n", "")
+            self.classification_text.insert(tk.END, *chunks)
+            
+            # Update latest classification label
+            latest = new_classifications[-1]
+            self._set(self.latest_class_label,
+                      f"Latest: {latest['prediction']} ({latest['confidence']:.1f}%)",
+                      self._get_color_for_class(latest['prediction']))
+            
+            self._n_class_rendered += len(new_classifications)
+            self._trim_log(self.classification_text)
+            self.classification_text.see(tk.END)
+    
+    def _trim_log(self, text_widget):
+        """Drop the oldest lines of a log view beyond MAX_LOG_LINES."""
+        line_count = int(text_widget.index('end-1c').split('.')[0])
+        overflow = line_count - MAX_LOG_LINES
+        if overflow > 0:
+            text_widget.delete('1.0', f'{overflow + 1}.0')
     
-    def _get_color_for_class(self, class_name):
+    @staticmethod
+    def _get_color_for_class(class_name):
         """Get color coding for different classes."""
-        colors = {
-            'Plain (Normal)': '#4CAF50',  # Green
-            'Minor Crack': '#FF9800',     # Orange
-            'Major Crack': '#f44336',     # Red
-            'Algae': '#00BCD4',           # Cyan
-            'Stain': '#9C27B0',           # Purple
-            'Peeling': '#FF5722',         # Deep Orange
-            'Spalling': '#E91E63'         # Pink
-        }
-        return colors.get(class_name, '#333')
+        return _CLASS_COLORS.get(class_name, '#333')
     
     def on_closing(self):
         """Handle window closing."""
@@ -443,17 +623,25 @@ class UnifiedMonitoringApp:
             if messagebox.askokcancel("Quit", 
                 "Recording in progress. Stop and quit?"):
                 self.stop_all()
-                self.camera_preview_running = False
+                self._stop_camera_preview()
                 self.root.destroy()
         else:
-            self.camera_preview_running = False
+            self._stop_camera_preview()
             self.root.destroy()
+    
+    def _stop_camera_preview(self):
+        """Stop the preview ticks and close the external window if open."""
+        self.camera_preview_running = False
+        if self._external_window_open:
+            self._close_external_preview()
 
 
 # Run the app
 if __name__ == "__main__":
     root = tk.Tk()
-    app = UnifiedMonitoringApp(root)
+    # SITELENZ_EXTERNAL_PREVIEW=1 moves the camera feed into an OpenCV window
+    external_preview = os.getenv("SITELENZ_EXTERNAL_PREVIEW", "0").lower() in ("1", "true", "yes")
+    app = UnifiedMonitoringApp(root, external_preview=external_preview)
     root.protocol("WM_DELETE_WINDOW", app.on_closing)
     
     # Center window